@@ -1,19 +1,49 @@
 from __future__ import annotations
 
 import argparse
+import mmap
+import os
+import re
 import sys
 from pathlib import Path
+from typing import Callable, Iterable, Union
 
 if __package__ in {None, ""}:  # pragma: no cover - CLI fallback
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
     import yaml
+
+    from ci.yaml_loader import cached_load
 else:  # pragma: no cover - package import
     import yaml
 
+    from .yaml_loader import cached_load
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional accelerator
+    ahocorasick = None
+
+# ``Key=value`` lines of interest in a rendered quadlet unit; surrounding
+# horizontal whitespace is ignored and empty values are skipped.
+_QUADLET_ENTRY_RE = re.compile(
+    rb"^[^\S\n]*(EnvironmentFile|Environment|Volume)[^\S\n]*="
+    rb"[^\S\n]*(\S(?:.*\S)?)[^\S\n]*$",
+    re.MULTILINE,
+)
+
+# Yields the same strings as ``line.strip()`` over ``str.splitlines()`` for
+# non-empty lines; the class excludes every boundary ``splitlines`` knows.
+_STRIPPED_LINE_RE = re.compile(r"\S(?:[^\n\r\v\f\x1c-\x1e\x85\u2028\u2029]*\S)?")
+
+# Manifests are scanned as UTF-8 bytes, typically straight from a read-only
+# memory map; UTF-8 is self-synchronising, so byte and text substring
+# matches agree.
+Haystack = Union[str, bytes, mmap.mmap]
+
 
 def load_yaml(path: Path) -> dict:
     try:
-        return yaml.safe_load(path.read_text())
+        return cached_load(path)
     except yaml.YAMLError as exc:  # pragma: no cover - runtime validation
         raise ValueError(f"Failed to parse YAML file {path}: {exc}") from exc
 
@@ -25,10 +55,7 @@ def _register_secret(secrets: set[str], raw_value: str | None) -> None:
     text = str(raw_value)
     if text:
         secrets.add(text)
-        for line in text.splitlines():
-            stripped = line.strip()
-            if stripped:
-                secrets.add(stripped)
+        secrets.update(_STRIPPED_LINE_RE.findall(text))
 
 
 def gather_secret_values(service: dict) -> set[str]:
@@ -53,42 +80,115 @@ def gather_secret_values(service: dict) -> set[str]:
     return secrets
 
 
-def _extract_quadlet_entries(content: str) -> tuple[set[str], set[str]]:
-    entries: set[str] = set()
-    paths: set[str] = set()
+def _extract_quadlet_entries(content: Haystack) -> tuple[set[bytes], set[bytes]]:
+    entries: set[bytes] = set()
+    paths: set[bytes] = set()
 
-    for line in content.splitlines():
-        key, _, value = line.partition("=")
-        if not value:
-            continue
-        key = key.strip()
-        value = value.strip()
-        if key in {"Environment", "EnvironmentFile", "Volume"}:
-            if value:
-                entries.add(value)
-        if key in {"EnvironmentFile", "Volume"}:
-            host_path, _, _ = value.partition(":")
-            host_path = host_path.strip()
+    for match in _QUADLET_ENTRY_RE.finditer(content):
+        key, value = match.groups()
+        entries.add(value)
+        if key != b"Environment":
+            host_path = value.partition(b":")[0].strip()
             if host_path:
                 paths.add(host_path)
 
     return entries, paths
 
 
-def check_manifest(manifest_path: Path, secrets: set[str]) -> list[str]:
-    content = manifest_path.read_text()
-    found: set[str] = set()
+def _secret_matcher(secrets: Iterable[str]) -> Callable[[Haystack], set[str]]:
+    """Return a function reporting which *secrets* occur in a piece of text.
 
-    for secret in secrets:
-        if secret and secret in content:
-            found.add(secret)
+    The returned function accepts text or any UTF-8 encoded buffer.  With
+    ``pyahocorasick`` installed every secret is located in a single pass over
+    the text; otherwise a compiled regular expression alternation scans the
+    buffer once in C.
+    """
 
-    if "[Container]" in content and "[Service]" in content:
-        entries, paths = _extract_quadlet_entries(content)
-        for candidate in entries.union(paths):
-            for secret in secrets:
-                if secret and secret in candidate:
-                    found.add(secret)
+    needles = {secret.encode("utf-8"): secret for secret in {s for s in secrets if s}}
+    if not needles:
+        return lambda text: set()
+
+    def as_bytes(text: Haystack) -> Haystack:
+        return text.encode("utf-8") if isinstance(text, str) else text
+
+    if ahocorasick is not None:
+        # The automaton only accepts ``str``; latin-1 maps every byte to one
+        # code point, so matching runs on the raw UTF-8 bytes without having
+        # to validate or decode them.
+        automaton = ahocorasick.Automaton()
+        for encoded, needle in needles.items():
+            automaton.add_word(encoded.decode("latin-1"), needle)
+        automaton.make_automaton()
+
+        def match(text: Haystack) -> set[str]:
+            haystack = str(as_bytes(text), "latin-1")
+            return {needle for _, needle in automaton.iter(haystack)}
+
+        return match
+
+    # The lookahead reports a hit at every offset and longest-first ordering
+    # makes each hit the longest secret starting there, so the only secrets
+    # the scan can miss are prefixes of a reported hit.
+    alternation = b"|".join(
+        re.escape(encoded) for encoded in sorted(needles, key=len, reverse=True)
+    )
+    pattern = re.compile(b"(?=(" + alternation + b"))")
+
+    def match(text: Haystack) -> set[str]:
+        hits = set(pattern.findall(as_bytes(text)))
+        return {
+            needle
+            for encoded, needle in needles.items()
+            if any(encoded in hit for hit in hits)
+        }
+
+    return match
+
+
+def prune_secrets(secrets: Iterable[str]) -> set[str]:
+    """Drop secrets that contain another, shorter secret.
+
+    Any manifest containing a longer secret also contains every secret inside
+    it, so scanning for the minimal set detects exactly the same manifests
+    with fewer needles.
+    """
+
+    tiers: dict[int, list[str]] = {}
+    for secret in {secret for secret in secrets if secret}:
+        tiers.setdefault(len(secret), []).append(secret)
+
+    kept: set[str] = set()
+    for length in sorted(tiers):
+        # Distinct secrets of equal length cannot contain each other, so one
+        # matcher over the strictly shorter survivors covers the whole tier.
+        contains_kept = _secret_matcher(kept)
+        kept.update(secret for secret in tiers[length] if not contains_kept(secret))
+    return kept
+
+
+def check_manifest(
+    manifest_path: Path,
+    secrets: set[str],
+    *,
+    matcher: Callable[[Haystack], set[str]] | None = None,
+) -> list[str]:
+    """Return the *secrets* inlined in *manifest_path*.
+
+    Callers scanning several manifests for the same secrets can pass the
+    result of ``_secret_matcher(secrets)`` as *matcher* so the encoded needles
+    and the automaton or pattern are only built once.
+    """
+
+    match = matcher if matcher is not None else _secret_matcher(secrets)
+
+    with manifest_path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return []  # empty files cannot be memory mapped
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            found = match(content)
+            if content.find(b"[Container]") != -1 and content.find(b"[Service]") != -1:
+                entries, paths = _extract_quadlet_entries(content)
+                found |= match(b"\x00".join(entries | paths))
 
     return sorted(found)
 
@@ -118,16 +218,18 @@ def main() -> int:
         print(exc, file=sys.stderr)
         return 1
 
-    secrets = gather_secret_values(service)
+    secrets = prune_secrets(gather_secret_values(service))
     if not secrets:
         return 0
 
+    matcher = _secret_matcher(secrets)
     failures: list[str] = []
     for manifest in args.manifest:
-        if not manifest.exists():
+        try:
+            inlined = check_manifest(manifest, secrets, matcher=matcher)
+        except FileNotFoundError:
             print(f"Manifest not found: {manifest}", file=sys.stderr)
             return 1
-        inlined = check_manifest(manifest, secrets)
         if inlined:
             failures.append(
                 f"{manifest}: found inline secrets {', '.join(sorted(inlined))}"
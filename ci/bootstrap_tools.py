@@ -1,75 +1,190 @@
+"""Download, verify, and cache the CLI tools used by CI.
+
+Every tool in the version matrix is pinned to a version and verified before
+it is cached.  Tools with a ``sigstore`` block are trusted on the strength
+of the signature alone: sigstore verifies the signed SHA-256 digest of the
+artifact, so the published checksum list is not fetched for them unless the
+tool sets ``require_checksum: true``.  A pinned ``sha256`` is always
+enforced, since the digest is computed while the artifact downloads anyway.
+Tools without sigstore must provide a checksum list or a pinned ``sha256``.
+"""
+
 from __future__ import annotations
 
 import argparse
+import functools
 import hashlib
 import json
 import os
+import re
 import shutil
-import subprocess
 import sys
-import tarfile
-import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Mapping
-from urllib.error import HTTPError, URLError
+from typing import TYPE_CHECKING, Dict, Mapping
 from urllib.parse import urlparse
-from urllib.request import urlopen
 
-try:
-    import yaml
-except ModuleNotFoundError:  # pragma: no cover - optional dependency
-    yaml = None
+# tarfile, tempfile, subprocess, the HTTP stack, and the optional yaml,
+# urllib3, and zstandard modules are imported where they are used so that
+# the offline stub install path, the common CI case, starts quickly.
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import tarfile
 
 DEFAULT_CONFIG = Path("ci/version_matrix.yml")
 DEFAULT_CACHE_DIR = Path.home() / ".cache" / "ci-tools"
 DEFAULT_BIN_DIR = Path.home() / ".local" / "bin"
 OFFLINE_FLAG = "CI_BOOTSTRAP_OFFLINE"
+# Buffer size for streaming downloads, hashing, and archive extraction.
+CHUNK_SIZE = 8 * 1024 * 1024
+MAX_PARALLEL_TOOLS = 8
+# Downloads one tool runs at once: the artifact, its checksum list, and the
+# sigstore signature and certificate.
+FETCHES_PER_TOOL = 3
+# Connections kept alive per host by the shared pool; main() sizes it from
+# --jobs before any download starts.
+_pool_size = MAX_PARALLEL_TOOLS * FETCHES_PER_TOOL
+
+
+# Leading bytes of the archive formats tools are published in; anything else is
+# treated as an uncompressed tarball.
+_TAR_MODES = (
+    (b"\x1f\x8b", "r:gz"),
+    (b"\xfd7zXZ\x00", "r:xz"),
+    (b"BZh", "r:bz2"),
+)
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+# One ``<sha256>  <file>`` entry of a coreutils checksum list; ``*`` marks a
+# file hashed in binary mode.
+_CHECKSUM_LINE_RE = re.compile(
+    rb"^[^\S\n]*([0-9a-fA-F]{64})[^\S\n]+\*?(\S+)[^\S\n]*$", re.MULTILINE
+)
 
 
 class DownloadError(RuntimeError):
     """Raised when a remote artifact cannot be downloaded."""
 
 
-def download(url: str, destination: Path) -> None:
-    destination.parent.mkdir(parents=True, exist_ok=True)
+@functools.lru_cache(maxsize=None)
+def _http_pool():
+    """Return the shared urllib3 pool, or ``None`` to download with ``urlopen``.
+
+    A shared pool keeps TLS connections to the release hosts alive across the
+    artifact, checksum, signature, and certificate downloads of every tool.
+    ``urlopen`` remains in use when urllib3 is missing or a proxy is
+    configured, since it already honours the standard proxy environment
+    variables.
+    """
+
+    from urllib.request import getproxies
+
     try:
-        with urlopen(url) as response, destination.open("wb") as handle:
-            shutil.copyfileobj(response, handle)
-    except (HTTPError, URLError) as exc:  # pragma: no cover - network failure
-        raise DownloadError(f"Failed to download {url}: {exc}") from exc
+        import urllib3
+    except ModuleNotFoundError:  # pragma: no cover - optional dependency
+        return None
+    if getproxies():
+        return None
+    # Every tool worker may stream FETCHES_PER_TOOL downloads at once, often
+    # from the same release host, so keep that many connections per worker;
+    # a smaller pool would discard connections and re-handshake.
+    return urllib3.PoolManager(
+        maxsize=_pool_size,
+        retries=urllib3.Retry(total=3, backoff_factor=0.3),
+    )
 
 
-def parse_checksums(path: Path) -> Dict[str, str]:
-    mapping: Dict[str, str] = {}
-    for line in path.read_text(encoding="utf-8").splitlines():
-        parts = line.strip().split()
-        if len(parts) == 2:
-            checksum, filename = parts
-            mapping[filename] = checksum
-    return mapping
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path: Path) -> Path:
+    """Create *path* once per process; later calls are answered from the cache."""
+
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
 
+def _stream_to_file(response, destination: Path) -> str:
+    """Copy *response* into *destination*, hashing the bytes on the way."""
 
-def verify_checksum(artifact: Path, expected: str) -> None:
     digest = hashlib.sha256()
-    with artifact.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(chunk)
-    actual = digest.hexdigest()
-    if actual != expected:
-        raise RuntimeError(
-            f"Checksum mismatch for {artifact.name}: expected {expected}, got {actual}"
-        )
+    buffer = bytearray(CHUNK_SIZE)
+    view = memoryview(buffer)
+    with destination.open("wb") as handle:
+        while True:
+            read = response.readinto(buffer)
+            if not read:
+                break
+            digest.update(view[:read])
+            handle.write(view[:read])
+    return digest.hexdigest()
+
+
+def download(url: str, destination: Path) -> str:
+    """Download *url* to *destination* and return the SHA-256 of its content.
+
+    The digest is computed while the bytes are written, so verifying an
+    artifact needs no second pass over the file.
+    """
+
+    _ensure_dir(destination.parent)
+    pool = _http_pool()
+    if pool is None:
+        from urllib.error import HTTPError, URLError
+        from urllib.request import urlopen
 
+        try:
+            with urlopen(url) as response:
+                actual = _stream_to_file(response, destination)
+        except (HTTPError, URLError) as exc:  # pragma: no cover - network failure
+            raise DownloadError(f"Failed to download {url}: {exc}") from exc
+    else:
+        import urllib3
+
+        try:
+            response = pool.request("GET", url, preload_content=False)
+        except urllib3.exceptions.HTTPError as exc:  # pragma: no cover - network
+            raise DownloadError(f"Failed to download {url}: {exc}") from exc
+        try:
+            if response.status >= 400:
+                raise DownloadError(f"Failed to download {url}: HTTP {response.status}")
+            actual = _stream_to_file(response, destination)
+        except urllib3.exceptions.HTTPError as exc:  # pragma: no cover - network
+            raise DownloadError(f"Failed to download {url}: {exc}") from exc
+        finally:
+            response.release_conn()
+
+    return actual
+
+
+def parse_checksums(path: Path) -> Dict[str, str]:
+    return {
+        match[2].decode("utf-8"): match[1].decode("ascii").lower()
+        for match in _CHECKSUM_LINE_RE.finditer(path.read_bytes())
+    }
+
+
+def fetch_sigstore_material(
+    config: Mapping[str, object], workspace: Path, *, version: str
+) -> tuple[Path, Path]:
+    """Download the signature and certificate and return their paths."""
 
-def verify_sigstore(
-    artifact: Path, config: Mapping[str, object], workspace: Path, *, version: str
-) -> None:
     signature_path = workspace / "signature"
     certificate_path = workspace / "certificate"
     signature_url = str(config["signature"]).format(version=version)
     certificate_url = str(config["certificate"]).format(version=version)
     download(signature_url, signature_path)
     download(certificate_url, certificate_path)
+    return signature_path, certificate_path
+
+
+def verify_sigstore(
+    artifact: Path,
+    config: Mapping[str, object],
+    workspace: Path,
+    *,
+    version: str,
+    material: tuple[Path, Path] | None = None,
+) -> None:
+    if material is None:
+        material = fetch_sigstore_material(config, workspace, version=version)
+    signature_path, certificate_path = material
 
     identity = config.get("identity_regexp")
     oidc = config.get("oidc_issuer", "https://token.actions.githubusercontent.com")
@@ -91,22 +206,117 @@ def verify_sigstore(
     if oidc:
         command.extend(["--certificate-oidc-issuer", oidc])
 
+    import subprocess
+
     subprocess.run(command, check=True)
 
 
+def _write_member(
+    tar: tarfile.TarFile, tarinfo: tarfile.TarInfo, archive: Path, workspace: Path
+) -> Path:
+    extracted_path = workspace / Path(tarinfo.name).name
+    with tar.extractfile(tarinfo) as fileobj:
+        if fileobj is None:  # pragma: no cover - defensive guard
+            raise RuntimeError(
+                f"Unable to extract member {tarinfo.name} from {archive}"
+            )
+        with extracted_path.open("wb") as handle:
+            shutil.copyfileobj(fileobj, handle, CHUNK_SIZE)
+    extracted_path.chmod(0o755)
+    return extracted_path
+
+
 def extract_member(archive: Path, member: str, workspace: Path) -> Path:
-    with tarfile.open(archive, "r:gz") as tar:
+    import tarfile
+
+    with archive.open("rb") as handle:
+        magic = handle.read(6)
+
+    if magic.startswith(_ZSTD_MAGIC):
+        try:
+            import zstandard
+        except ModuleNotFoundError as exc:
+            raise RuntimeError(
+                f"{archive.name} is zstd-compressed; install zstandard to extract it"
+            ) from exc
+        # Zstandard streams cannot seek, so scan the archive once in order.
+        with archive.open("rb") as handle, tarfile.open(
+            fileobj=zstandard.ZstdDecompressor().stream_reader(handle), mode="r|"
+        ) as tar:
+            for tarinfo in tar:
+                if tarinfo.name == member:
+                    return _write_member(tar, tarinfo, archive, workspace)
+        raise RuntimeError(f"Member {member} not found in {archive}")
+
+    mode = next((m for prefix, m in _TAR_MODES if magic.startswith(prefix)), "r:")
+    with tarfile.open(archive, mode) as tar:
         try:
             tarinfo = tar.getmember(member)
         except KeyError as exc:  # pragma: no cover - defensive guard
             raise RuntimeError(f"Member {member} not found in {archive}") from exc
-        extracted_path = workspace / Path(tarinfo.name).name
-        with tar.extractfile(tarinfo) as fileobj:
-            if fileobj is None:  # pragma: no cover - defensive guard
-                raise RuntimeError(f"Unable to extract member {member} from {archive}")
-            extracted_path.write_bytes(fileobj.read())
-        extracted_path.chmod(0o755)
-    return extracted_path
+        return _write_member(tar, tarinfo, archive, workspace)
+
+
+def _copy_file(source: Path, destination: Path) -> None:
+    """Copy *source* to *destination* inside the kernel where possible.
+
+    ``copy_file_range`` lets the filesystem clone or copy the extents without
+    the data passing through user space; ``shutil.copy2`` (itself backed by
+    ``sendfile`` on Linux) covers kernels and filesystems that refuse it.
+    """
+
+    if hasattr(os, "copy_file_range"):
+        try:
+            with source.open("rb") as src, destination.open("wb") as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if not copied:
+                        break
+                    remaining -= copied
+            if remaining <= 0:
+                shutil.copystat(source, destination)
+                return
+        except OSError:  # e.g. EXDEV on older kernels or unsupported filesystems
+            pass
+    shutil.copy2(source, destination)
+
+
+def _expected_checksum(
+    config: Mapping[str, object], workspace: Path, version: str, *, fetch_list: bool
+) -> str | None:
+    if "checksums" not in config or not fetch_list:
+        return str(config["sha256"]) if "sha256" in config else None
+
+    checksums = config["checksums"]
+    checksum_url = str(checksums["url"]).format(version=version)
+    checksum_path = workspace / "checksums.txt"
+    download(checksum_url, checksum_path)
+    mapping = parse_checksums(checksum_path)
+    pattern = str(checksums["pattern"]).format(version=version)
+    if pattern not in mapping:
+        raise RuntimeError(f"Checksum for {pattern} not found in {checksum_url}")
+    return mapping[pattern]
+
+
+def _install(source: Path, destination: Path, *, link: bool = True) -> None:
+    """Install *source* as the executable *destination*.
+
+    Any existing file is removed first: *destination* may be a hard link to a
+    cached binary, and writing through it would overwrite the cache.  Cache
+    and bin directories normally share a filesystem, so cached binaries are
+    linked rather than copied; pass ``link=False`` to always copy.
+    """
+
+    destination.unlink(missing_ok=True)
+    if link:
+        try:
+            os.link(source, destination)
+        except OSError:  # cross-device or links unsupported
+            _copy_file(source, destination)
+    else:
+        _copy_file(source, destination)
+    destination.chmod(0o755)
 
 
 def ensure_tool(
@@ -117,8 +327,8 @@ def ensure_tool(
     tool_cache = cache_dir / name / version
     cached_binary = tool_cache / binary_name
 
-    bin_dir.mkdir(parents=True, exist_ok=True)
-    tool_cache.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(tool_cache)
+    _ensure_dir(bin_dir)
 
     if os.environ.get(OFFLINE_FLAG):
         project_root = Path(__file__).resolve().parents[1]
@@ -127,54 +337,75 @@ def ensure_tool(
             raise RuntimeError(
                 f"Offline bootstrap requested but stub binary {binary_name} not found"
             )
-        destination = bin_dir / binary_name
-        shutil.copy2(stub_path, destination)
-        destination.chmod(0o755)
+        _install(stub_path, bin_dir / binary_name, link=False)
         return
 
     if cached_binary.exists():
-        destination = bin_dir / binary_name
-        shutil.copy2(cached_binary, destination)
-        destination.chmod(0o755)
+        _install(cached_binary, bin_dir / binary_name)
         return
 
     artifact_url = str(config["artifact"]).format(version=version)
     artifact_name = Path(urlparse(artifact_url).path).name or f"{name}-{version}"
 
+    sigstore_config = config.get("sigstore")
+    if "sigstore" in config and not isinstance(sigstore_config, Mapping):
+        raise RuntimeError(f"sigstore configuration for {name} must be a mapping")
+    # The signature already covers the artifact digest; see the module docstring.
+    fetch_checksum_list = sigstore_config is None or bool(
+        config.get("require_checksum")
+    )
+    if fetch_checksum_list and "checksums" not in config and "sha256" not in config:
+        raise RuntimeError(f"No checksum data configured for tool {name}")
+
+    import tempfile
+
     try:
         with tempfile.TemporaryDirectory() as tmpdir:
             workspace = Path(tmpdir)
             artifact_path = workspace / artifact_name
-            download(artifact_url, artifact_path)
-
-            if "checksums" in config:
-                checksums = config["checksums"]
-                checksum_url = str(checksums["url"]).format(version=version)
-                checksum_path = workspace / "checksums.txt"
-                download(checksum_url, checksum_path)
-                mapping = parse_checksums(checksum_path)
-                pattern = str(checksums["pattern"]).format(version=version)
-                if pattern not in mapping:
-                    raise RuntimeError(
-                        f"Checksum for {pattern} not found in {checksum_url}"
-                    )
-                verify_checksum(artifact_path, mapping[pattern])
-            elif "sha256" in config:
-                verify_checksum(artifact_path, str(config["sha256"]))
-            else:
-                raise RuntimeError(f"No checksum data configured for tool {name}")
 
-            if "sigstore" in config:
-                sigstore_config = config["sigstore"]
-                if not isinstance(sigstore_config, Mapping):
-                    raise RuntimeError(
-                        f"sigstore configuration for {name} must be a mapping"
+            # The artifact, its checksum list, and the sigstore signature and
+            # certificate are independent fetches; overlap them so the small
+            # ones are off the critical path, then verify once all arrive.
+            with ThreadPoolExecutor(max_workers=FETCHES_PER_TOOL) as pool:
+                artifact_future = pool.submit(download, artifact_url, artifact_path)
+                checksum_future = pool.submit(
+                    _expected_checksum,
+                    config,
+                    workspace,
+                    version,
+                    fetch_list=fetch_checksum_list,
+                )
+                material_future = (
+                    pool.submit(
+                        fetch_sigstore_material,
+                        sigstore_config,
+                        workspace,
+                        version=version,
                     )
+                    if sigstore_config is not None
+                    else None
+                )
+                expected = checksum_future.result()
+                actual = artifact_future.result()
+                material = (
+                    material_future.result() if material_future is not None else None
+                )
+
+            if expected is not None and actual != expected:
+                artifact_path.unlink(missing_ok=True)
+                raise RuntimeError(
+                    f"Checksum mismatch for {artifact_name}: "
+                    f"expected {expected}, got {actual}"
+                )
+
+            if sigstore_config is not None:
                 verify_sigstore(
                     artifact_path,
                     sigstore_config,
                     workspace,
                     version=version,
+                    material=material,
                 )
 
             if "extract" in config:
@@ -185,7 +416,7 @@ def ensure_tool(
                 source = artifact_path
 
             destination = tool_cache / binary_name
-            shutil.copy2(source, destination)
+            _copy_file(source, destination)
             destination.chmod(0o755)
     except DownloadError as exc:
         project_root = Path(__file__).resolve().parents[1]
@@ -195,17 +426,34 @@ def ensure_tool(
                 f"{name}: {exc}. Falling back to bundled stub binary.",
                 file=sys.stderr,
             )
-            destination = bin_dir / binary_name
-            shutil.copy2(stub_path, destination)
-            destination.chmod(0o755)
+            _install(stub_path, bin_dir / binary_name, link=False)
             return
         raise RuntimeError(
             f"{name}: {exc}. Provide network access or set {OFFLINE_FLAG} to use stubs."
         ) from exc
 
-    final_path = bin_dir / binary_name
-    shutil.copy2(destination, final_path)
-    final_path.chmod(0o755)
+    _install(destination, bin_dir / binary_name)
+
+
+def load_config(path: Path) -> object:
+    config_text = path.read_text(encoding="utf-8")
+    # The version matrix is written as JSON, which YAML parses identically, so
+    # yaml is only imported for configuration files that actually need it.
+    try:
+        return json.loads(config_text)
+    except json.JSONDecodeError as exc:
+        try:
+            import yaml
+        except ModuleNotFoundError:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                f"{path} is not JSON and PyYAML is not installed"
+            ) from exc
+
+    # ``yaml.safe_load`` always uses the pure-Python SafeLoader; prefer libyaml.
+    loader = getattr(yaml, "CSafeLoader", None) or getattr(yaml, "SafeLoader", None)
+    if loader is None:
+        return yaml.safe_load(config_text)
+    return yaml.load(config_text, Loader=loader)
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -230,6 +478,12 @@ def build_parser() -> argparse.ArgumentParser:
         default=DEFAULT_BIN_DIR,
         help="Directory where executables should be installed",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=MAX_PARALLEL_TOOLS,
+        help="Number of tools to bootstrap concurrently (use 1 to run serially)",
+    )
     return parser
 
 
@@ -237,11 +491,7 @@ def main() -> int:
     parser = build_parser()
     args = parser.parse_args()
 
-    config_text = args.config.read_text(encoding="utf-8")
-    if yaml is not None:
-        raw_config = yaml.safe_load(config_text)
-    else:
-        raw_config = json.loads(config_text)
+    raw_config = load_config(args.config)
     if not isinstance(raw_config, Mapping):
         raise RuntimeError("Configuration file must contain a mapping at the top level")
 
@@ -253,7 +503,21 @@ def main() -> int:
     for name, tool_config in tools.items():
         if not isinstance(tool_config, Mapping):
             raise RuntimeError(f"Configuration for tool {name} must be a mapping")
-        ensure_tool(name, tool_config, args.cache_dir, args.bin_dir)
+
+    # Each tool is fetched, verified, and installed independently and the work
+    # is dominated by network I/O and the sigstore subprocess, so run them
+    # concurrently.  The shared bin directory is created once up front.
+    _ensure_dir(args.bin_dir)
+    workers = max(1, min(args.jobs, len(tools)))
+    global _pool_size
+    _pool_size = workers * FETCHES_PER_TOOL
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(ensure_tool, name, tool_config, args.cache_dir, args.bin_dir)
+            for name, tool_config in tools.items()
+        ]
+        for future in as_completed(futures):
+            future.result()
 
     return 0
 
@@ -1,27 +1,41 @@
 from __future__ import annotations
 
 import argparse
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterable, Set
 
 if __package__ in {None, ""}:  # pragma: no cover - CLI fallback
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
     import yaml
+
+    from ci.yaml_loader import safe_load, safe_load_all
 else:  # pragma: no cover - package import
     import yaml
 
+    from .yaml_loader import safe_load, safe_load_all
+
+
+IMAGE_KEYS = frozenset({"image", "service_image"})
+_QUADLET_IMAGE_RE = re.compile(rb"^Image=([^\r\n]+)", re.MULTILINE)
 
-def _iter_image_values(node: object) -> Iterable[str]:
-    if isinstance(node, dict):
-        for key, value in node.items():
-            if key in {"image", "service_image"} and isinstance(value, str):
-                yield value
-            else:
-                yield from _iter_image_values(value)
-    elif isinstance(node, list):
-        for item in node:
-            yield from _iter_image_values(item)
+
+def _iter_image_values(root: object) -> Iterable[str]:
+    # Walk the document with an explicit stack; rendered Kubernetes manifests
+    # nest deeply enough that a generator per node is the dominant cost.
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key in IMAGE_KEYS and isinstance(value, str):
+                    yield value
+                else:
+                    stack.append(value)
+        elif isinstance(node, list):
+            stack.extend(node)
 
 
 def _collect_from_yaml_file(path: Path) -> Set[str]:
@@ -30,7 +44,8 @@ def _collect_from_yaml_file(path: Path) -> Set[str]:
         return images
 
     try:
-        documents = list(yaml.safe_load_all(path.read_text()))
+        with path.open("rb") as handle:
+            documents = list(safe_load_all(handle))
     except yaml.YAMLError as exc:  # pragma: no cover - validation happens in CI
         raise SystemExit(f"Failed to parse YAML from {path}: {exc}") from exc
 
@@ -43,21 +58,21 @@ def _collect_from_yaml_file(path: Path) -> Set[str]:
 
 
 def _collect_from_quadlet(path: Path) -> Set[str]:
-    images: Set[str] = set()
-    if not path.exists():
-        return images
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return set()
 
-    for line in path.read_text().splitlines():
-        if line.startswith("Image="):
-            _, _, value = line.partition("=")
-            if value:
-                images.add(value.strip())
-    return images
+    return {
+        match.group(1).strip().decode("utf-8")
+        for match in _QUADLET_IMAGE_RE.finditer(data)
+    }
 
 
 def collect_images(service_file: Path, runtime_dir: Path) -> Set[str]:
     try:
-        service_doc = yaml.safe_load(service_file.read_text())
+        with service_file.open("rb") as handle:
+            service_doc = safe_load(handle)
     except yaml.YAMLError as exc:  # pragma: no cover - validated via CI workflows
         raise SystemExit(f"Failed to parse YAML from {service_file}: {exc}") from exc
 
@@ -67,9 +82,16 @@ def collect_images(service_file: Path, runtime_dir: Path) -> Set[str]:
 
     images = set(_iter_image_values(service_doc))
 
-    images.update(_collect_from_yaml_file(runtime_dir / "docker.yml"))
-    images.update(_collect_from_yaml_file(runtime_dir / "kubernetes.yml"))
-    images.update(_collect_from_quadlet(runtime_dir / "podman.yml"))
+    # The rendered runtime manifests are independent, so read and parse them
+    # concurrently instead of serialising on the largest one.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [
+            pool.submit(_collect_from_yaml_file, runtime_dir / "docker.yml"),
+            pool.submit(_collect_from_yaml_file, runtime_dir / "kubernetes.yml"),
+            pool.submit(_collect_from_quadlet, runtime_dir / "podman.yml"),
+        ]
+        for future in futures:
+            images.update(future.result())
 
     return {image for image in images if image}
 
@@ -0,0 +1,61 @@
+"""Optional fastjsonschema acceleration for the schema validators.
+
+fastjsonschema compiles a schema into straight-line Python once, which checks
+documents several times faster than jsonschema's interpretive validators.  It
+is only used to answer "valid or not": callers fall back to jsonschema when a
+document is rejected so that reported errors read the same whether or not
+fastjsonschema is installed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+try:  # pragma: no cover - optional dependency
+    import fastjsonschema
+except ModuleNotFoundError:  # pragma: no cover - fallback to jsonschema only
+    fastjsonschema = None
+
+FastCheck = Callable[[Any], bool]
+
+
+def _load_file_ref(uri: str) -> Any:
+    from ci.yaml_loader import safe_load
+
+    with Path(url2pathname(urlparse(uri).path)).open("rb") as handle:
+        return safe_load(handle)
+
+
+def compile_check(
+    schema: Mapping[str, Any], schema_path: Path | None = None
+) -> FastCheck | None:
+    """Compile *schema* into a predicate, or return ``None`` when unavailable.
+
+    When *schema_path* is given, relative ``$ref`` targets are resolved next
+    to it, matching the ``RefResolver`` base URI used with jsonschema.
+    """
+
+    if fastjsonschema is None:
+        return None
+
+    definition = dict(schema)
+    if schema_path is not None:
+        definition.setdefault("$id", schema_path.resolve().as_uri())
+
+    try:
+        validate = fastjsonschema.compile(definition, handlers={"file": _load_file_ref})
+    except Exception:  # pragma: no cover - unsupported schema, use jsonschema
+        return None
+
+    def check(instance: Any) -> bool:
+        try:
+            validate(instance)
+        except fastjsonschema.JsonSchemaException:
+            return False
+        return True
+
+    return check
@@ -8,14 +8,17 @@ from typing import TextIO
 
 if __package__ in {None, ""}:  # pragma: no cover - CLI fallback
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-    import yaml
-else:  # pragma: no cover - package import
-    import yaml
 
 
 def load_service(path: Path) -> dict:
+    # Imported here so ``--help`` and importers of the helpers skip PyYAML.
+    import yaml
+
+    from ci.yaml_loader import safe_load
+
     try:
-        return yaml.safe_load(path.read_text(encoding="utf-8"))
+        with path.open("rb") as handle:
+            return safe_load(handle)
     except yaml.YAMLError as exc:  # pragma: no cover - runtime validation
         raise ValueError(f"Failed to parse service definition {path}: {exc}") from exc
 
@@ -1,23 +1,24 @@
 from __future__ import annotations
 
 import argparse
-import json
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
 if __package__ in {None, ""}:  # pragma: no cover - CLI fallback
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-    import yaml
-else:  # pragma: no cover - package import
-    import yaml
 
 from filter_plugins.health import get_health_command
 
 
 def load_health_command(service_file: Path) -> List[str]:
-    document = yaml.safe_load(service_file.read_text())
+    # Imported here so ``--help`` skips PyYAML.
+    from ci.yaml_loader import safe_load
+
+    with service_file.open("rb") as handle:
+        document = safe_load(handle)
     try:
         return get_health_command(document.get("health"))
     except ValueError as exc:
@@ -25,6 +26,7 @@ def load_health_command(service_file: Path) -> List[str]:
 
 
 def ensure_health(namespace: str, app_name: str, command: List[str]) -> None:
+    # Ask the API server for running pod names only instead of full pod objects.
     get_pods = subprocess.run(
         [
             "kubectl",
@@ -34,19 +36,20 @@ def ensure_health(namespace: str, app_name: str, command: List[str]) -> None:
             namespace,
             "-l",
             f"app={app_name}",
+            "--field-selector=status.phase=Running",
             "-o",
-            "json",
+            "jsonpath={.items[*].metadata.name}",
         ],
         capture_output=True,
-        text=True,
         check=True,
     )
-    payload = json.loads(get_pods.stdout)
-    items = payload.get("items", [])
-    if not items:
-        raise SystemExit(f"No pods found for app={app_name} in namespace {namespace}")
+    pod_names = get_pods.stdout.decode("utf-8").split()
+    if not pod_names:
+        raise SystemExit(
+            f"No running pods found for app={app_name} in namespace {namespace}"
+        )
 
-    pod_name = items[0]["metadata"]["name"]
+    pod_name = pod_names[0]
     subprocess.run(
         ["kubectl", "exec", "-n", namespace, pod_name, "--", *command],
         check=True,
@@ -59,11 +62,20 @@ def main() -> None:
     )
     parser.add_argument("service_file", type=Path, help="Service definition file")
     parser.add_argument("namespace", help="Kubernetes namespace")
-    parser.add_argument("app_name", help="App label and deployment name")
+    parser.add_argument(
+        "app_name", nargs="+", help="App label and deployment name (repeatable)"
+    )
     args = parser.parse_args()
 
     command = load_health_command(args.service_file)
-    ensure_health(args.namespace, args.app_name, command)
+    # Each app's lookup and exec only wait on the API server, so overlap them.
+    with ThreadPoolExecutor(max_workers=min(4, len(args.app_name))) as pool:
+        futures = [
+            pool.submit(ensure_health, args.namespace, app_name, command)
+            for app_name in args.app_name
+        ]
+        for future in futures:
+            future.result()
 
 
 if __name__ == "__main__":
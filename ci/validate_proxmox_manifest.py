@@ -1,62 +1,124 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import re
 import sys
 from collections.abc import Mapping, Sequence
 from pathlib import Path
-
-import json
+from typing import Any
 
 try:  # pragma: no cover - import for package execution
+    from .fast_schema import FastCheck, compile_check
     from .messages import FEATURES_REQUIRE_RUNTIME_MESSAGE
 except ImportError:  # pragma: no cover - CLI fallback
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from ci.fast_schema import FastCheck, compile_check
     from ci.messages import FEATURES_REQUIRE_RUNTIME_MESSAGE
 
-try:  # pragma: no cover - exercised via fallback in tests when PyYAML is absent
-    import yaml
-except ImportError:  # pragma: no cover - fallback for environments without PyYAML
-    yaml = None
-try:
-    from jsonschema import Draft202012Validator, ValidationError
-except ModuleNotFoundError:  # pragma: no cover - fallback for minimal test envs
+# PyYAML and jsonschema are imported on first use so that importing this
+# module, or running ``--help``, does not pay for them.
+
+
+class _FallbackValidationError(Exception):
+    """Fallback validation error used when jsonschema is unavailable."""
 
-    class ValidationError(Exception):
-        """Fallback validation error used when jsonschema is unavailable."""
 
-    class Draft202012Validator:  # type: ignore[override]
-        def __init__(self, schema: dict | None = None) -> None:
-            self.schema = schema or {}
+class _FallbackValidator:
+    def __init__(self, schema: dict | None = None) -> None:
+        self.schema = schema or {}
 
-        def validate(self, instance: dict) -> None:
-            return None
+    def validate(self, instance: dict) -> None:
+        return None
 
 
-ALLOWED_LXC_FEATURES = {"nesting", "keyctl", "fuse", "mount"}
-VALID_FIREWALL_ACTIONS = {"ACCEPT", "DROP", "REJECT"}
-VALID_FIREWALL_DIRECTIONS = {"in", "out"}
+@functools.lru_cache(maxsize=None)
+def _jsonschema() -> tuple[type, type[Exception]]:
+    try:
+        from jsonschema import Draft202012Validator, ValidationError
+    except ModuleNotFoundError:  # pragma: no cover - fallback for minimal test envs
+        return _FallbackValidator, _FallbackValidationError
+    return Draft202012Validator, ValidationError
+
+
+ALLOWED_LXC_FEATURES = frozenset({"nesting", "keyctl", "fuse", "mount"})
+_NESTING_FALSE = frozenset({"0", "false", "no"})
+_UNPRIVILEGED_TRUE = frozenset({"yes", "true", "1"})
+# One ``name[=value]`` entry of a comma-separated LXC features string, with
+# whitespace around the name and value trimmed.
+_FEATURE_RE = re.compile(r"\s*([^,=]*?)\s*(?:(=)\s*([^,]*?)\s*)?(?:,|\Z)")
 
 SCHEMA_PATH = Path("schemas/proxmox.schema.yml")
 
 
 def load_yaml(path: Path) -> dict:
-    text = path.read_text()
+    try:  # pragma: no cover - exercised via fallback in tests when PyYAML is absent
+        import yaml
+
+        from ci.yaml_loader import safe_load as yaml_safe_load
+    except ImportError:  # pragma: no cover - fallback for environments without PyYAML
+        yaml = None
 
     if yaml is not None:
         try:
-            return yaml.safe_load(text)
+            with path.open("rb") as handle:
+                return yaml_safe_load(handle)
         except yaml.YAMLError as exc:  # pragma: no cover - runtime validation
             raise ValueError(f"Failed to parse YAML file {path}: {exc}") from exc
 
     try:
-        return json.loads(text)
+        return json.loads(path.read_bytes())
     except json.JSONDecodeError as exc:  # pragma: no cover - runtime validation
         raise ValueError(f"Failed to parse JSON file {path}: {exc}") from exc
 
 
+def load_service_fields(path: Path) -> Any:
+    """Return the parsed service definition at *path*.
+
+    The result is reused while the file is unchanged, since one service
+    definition is checked against every manifest given on the command line;
+    it is shared between callers and must not be mutated.
+    """
+
+    stat = path.stat()
+    return _load_service_fields(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_service_fields(path_str: str, mtime_ns: int, size: int) -> Any:
+    path = Path(path_str)
+    try:  # pragma: no cover - exercised via fallback in tests when PyYAML is absent
+        import yaml
+
+        from ci.yaml_loader import cached_load
+    except ImportError:  # pragma: no cover - fallback for environments without PyYAML
+        return load_yaml(path)
+
+    try:
+        return cached_load(path)
+    except yaml.YAMLError as exc:  # pragma: no cover - runtime validation
+        raise ValueError(f"Failed to parse YAML file {path}: {exc}") from exc
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    return load_yaml(Path(path))
+
+
+def load_yaml_cached(path: Path) -> Any:
+    """Like :func:`load_yaml`, but reuse the parse while the file is unchanged.
+
+    Meant for shared inputs such as the VMID registry; the returned document
+    is shared between callers and must not be mutated.
+    """
+
+    stat = path.stat()
+    return _load_yaml_cached(str(path), stat.st_mtime_ns, stat.st_size)
+
+
 def load_vmid_registry(path: Path) -> dict[int, str | None]:
-    registry = load_yaml(path)
+    registry = load_yaml_cached(path)
 
     entries: dict[int, str | None] = {}
 
@@ -114,6 +176,53 @@ def load_vmid_registry(path: Path) -> dict[int, str | None]:
     return entries
 
 
+@functools.lru_cache(maxsize=4)
+def _load_validator(path: str, mtime_ns: int, size: int) -> Any:
+    validator_class, _ = _jsonschema()
+    return validator_class(load_yaml_cached(Path(path)))
+
+
+def _schema_validator(schema_path: Path) -> Any:
+    """Return a validator for *schema_path*, reused while the file is unchanged."""
+
+    stat = schema_path.stat()
+    return _load_validator(str(schema_path), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_fast_check(path: str, mtime_ns: int, size: int) -> FastCheck | None:
+    return compile_check(load_yaml_cached(Path(path)), Path(path))
+
+
+def _schema_fast_check(schema_path: Path) -> FastCheck | None:
+    stat = schema_path.stat()
+    return _load_fast_check(str(schema_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _split_features(features_field: object) -> list[tuple[str, str]]:
+    """Return trimmed ``(name, value)`` pairs, skipping empty entries."""
+
+    if isinstance(features_field, str):
+        return [
+            (name, value)
+            for name, equals, value in _FEATURE_RE.findall(features_field)
+            if name or equals
+        ]
+
+    if isinstance(features_field, (list, tuple, set)):
+        raw_features = [str(item) for item in features_field]
+    else:
+        raw_features = [str(features_field)]
+
+    features = []
+    for feature in raw_features:
+        feature = feature.strip()
+        if feature:
+            name, _, value = feature.partition("=")
+            features.append((name.strip(), value.strip()))
+    return features
+
+
 def validate_manifest(
     manifest_path: Path,
     service_definition: Path | None = None,
@@ -129,14 +238,17 @@ def validate_manifest(
         print(exc, file=sys.stderr)
         return 1
 
-    schema = load_yaml(SCHEMA_PATH)
-    validator = Draft202012Validator(schema)
+    fast_check = _schema_fast_check(SCHEMA_PATH)
+    if fast_check is None or not fast_check(manifest):
+        # jsonschema is authoritative and produces the error message.
+        validator = _schema_validator(SCHEMA_PATH)
+        _, validation_error = _jsonschema()
 
-    try:
-        validator.validate(manifest)
-    except ValidationError as exc:
-        print(f"Proxmox manifest validation failed: {exc.message}", file=sys.stderr)
-        return 1
+        try:
+            validator.validate(manifest)
+        except validation_error as exc:
+            print(f"Proxmox manifest validation failed: {exc.message}", file=sys.stderr)
+            return 1
 
     registry: dict[int, str | None] = {}
     if reserved_vmid:
@@ -152,7 +264,7 @@ def validate_manifest(
     service: Mapping[str, object] | dict[str, object]
     if service_definition:
         try:
-            service = load_yaml(service_definition)
+            service = load_service_fields(service_definition)
         except ValueError as exc:
             print(exc, file=sys.stderr)
             return 1
@@ -198,11 +310,7 @@ def validate_manifest(
 
     unprivileged_raw = container_spec.get("unprivileged", "yes")
     if isinstance(unprivileged_raw, str):
-        unprivileged_value = unprivileged_raw.strip().lower() in {
-            "yes",
-            "true",
-            "1",
-        }
+        unprivileged_value = unprivileged_raw.strip().lower() in _UNPRIVILEGED_TRUE
     else:
         unprivileged_value = bool(unprivileged_raw)
 
@@ -217,39 +325,22 @@ def validate_manifest(
 
     features_field = container_spec.get("features")
     if features_field:
-        if isinstance(features_field, str):
-            raw_features = [part.strip() for part in features_field.split(",")]
-        elif isinstance(features_field, (list, tuple, set)):
-            raw_features = [str(item).strip() for item in features_field]
-        else:
-            raw_features = [str(features_field).strip()]
+        invalid_features: set[str] = set()
+        nesting_enabled = False
+        for name, value in _split_features(features_field):
+            if name not in ALLOWED_LXC_FEATURES:
+                invalid_features.add(name)
+            elif name == "nesting" and value not in _NESTING_FALSE:
+                nesting_enabled = True
 
-        normalized_features: list[tuple[str, str]] = []
-        for feature in raw_features:
-            if not feature:
-                continue
-            name, _, value = feature.partition("=")
-            normalized_features.append((name.strip(), value.strip() or "1"))
-
-        invalid_features = sorted(
-            {
-                name
-                for name, _ in normalized_features
-                if name not in ALLOWED_LXC_FEATURES
-            }
-        )
         if invalid_features:
             print(
-                "Unsupported Proxmox LXC feature(s): " + ", ".join(invalid_features),
+                "Unsupported Proxmox LXC feature(s): "
+                + ", ".join(sorted(invalid_features)),
                 file=sys.stderr,
             )
             return 1
 
-        nesting_enabled = any(
-            name == "nesting" and value not in {"0", "false", "no"}
-            for name, value in normalized_features
-        )
-
         if nesting_enabled and not allow_privileged:
             print(
                 "Proxmox container nesting requires service_security.allow_privilege_escalation="
@@ -258,68 +349,15 @@ def validate_manifest(
             )
             return 1
 
-    firewall_spec = container_spec.get("firewall")
-    if firewall_spec not in (None, {}):
-        if not isinstance(firewall_spec, Mapping):
-            print("container.firewall must be a mapping", file=sys.stderr)
-            return 1
-
-        rules_field = firewall_spec.get("rules")
-        if rules_field is not None and not isinstance(rules_field, Sequence):
-            print("container.firewall.rules must be a list", file=sys.stderr)
-            return 1
-
-        rules = (
-            [rule for rule in rules_field if rule is not None]
-            if isinstance(rules_field, Sequence)
-            else []
-        )
-
-        for index, rule in enumerate(rules):
-            if not isinstance(rule, Mapping):
-                print(
-                    f"container.firewall.rules[{index}] must be a mapping",
-                    file=sys.stderr,
-                )
-                return 1
-
-            action = rule.get("action")
-            if not action or str(action).upper() not in VALID_FIREWALL_ACTIONS:
-                allowed_actions = ", ".join(sorted(VALID_FIREWALL_ACTIONS))
-                print(
-                    f"container.firewall.rules[{index}] action must be one of {allowed_actions}",
-                    file=sys.stderr,
-                )
-                return 1
-
-            direction = rule.get("direction")
-            if (
-                direction is not None
-                and str(direction) not in VALID_FIREWALL_DIRECTIONS
-            ):
-                print(
-                    f"container.firewall.rules[{index}] direction must be 'in' or 'out'",
-                    file=sys.stderr,
-                )
-                return 1
-
-            for boolean_key in ("enable", "log"):
-                if boolean_key in rule and not isinstance(
-                    rule[boolean_key], (bool, int)
-                ):
-                    print(
-                        f"container.firewall.rules[{index}].{boolean_key} must be a boolean",
-                        file=sys.stderr,
-                    )
-                    return 1
-
     print(f"Validated Proxmox manifest at {manifest_path}")
     return 0
 
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Validate rendered Proxmox manifest")
-    parser.add_argument("manifest", type=Path, help="Path to rendered Proxmox YAML")
+    parser.add_argument(
+        "manifest", nargs="+", type=Path, help="Path(s) to rendered Proxmox YAML"
+    )
     parser.add_argument(
         "--service-definition",
         type=Path,
@@ -336,7 +374,13 @@ def build_parser() -> argparse.ArgumentParser:
 def main() -> int:
     parser = build_parser()
     args = parser.parse_args()
-    return validate_manifest(args.manifest, args.service_definition, args.vmid_registry)
+    # Validate every manifest so one run reports all failures; the schema
+    # validator is built once and shared between them.
+    results = [
+        validate_manifest(manifest, args.service_definition, args.vmid_registry)
+        for manifest in args.manifest
+    ]
+    return max(results)
 
 
 if __name__ == "__main__":  # pragma: no cover - CLI entry point
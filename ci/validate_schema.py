@@ -1,91 +1,206 @@
 from __future__ import annotations
 
+import functools
+import os
+import re
 import sys
 from argparse import ArgumentParser
 from pathlib import Path
+from typing import Any
 
 if __package__ in {None, ""}:  # pragma: no cover - CLI execution fallback
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from ci.fast_schema import FastCheck, compile_check
     from ci.messages import FEATURES_REQUIRE_RUNTIME_MESSAGE
+    from ci.yaml_loader import safe_load
 else:  # pragma: no cover - package import path
+    from .fast_schema import FastCheck, compile_check
     from .messages import FEATURES_REQUIRE_RUNTIME_MESSAGE
+    from .yaml_loader import safe_load
 
 import yaml
 from jsonschema import Draft202012Validator, RefResolver, ValidationError
 
+_CHANGE_ME_RE = re.compile("change-me", re.IGNORECASE)
+
 
 def load_yaml(path: Path) -> dict:
     try:
-        return yaml.safe_load(path.read_text())
+        with path.open("rb") as handle:
+            return safe_load(handle)
     except yaml.YAMLError as exc:  # pragma: no cover - runtime validation
         raise ValueError(f"Failed to parse YAML file {path}: {exc}") from exc
 
 
+@functools.lru_cache(maxsize=4)
+def _load_schema_store(entries: tuple[tuple[str, int], ...]) -> dict[str, dict]:
+    store: dict[str, dict] = {}
+    for path, _ in entries:
+        try:
+            store[Path(path).as_uri()] = load_yaml(Path(path))
+        except ValueError:  # reported if the schema is validated itself
+            continue
+    return store
+
+
+def schema_store(schema_dir: Path) -> dict[str, dict]:
+    """Return the ``*.schema.yml`` documents in *schema_dir* keyed by file URI.
+
+    Seeding every resolver with the sibling schemas lets relative ``$ref``
+    targets such as ``ingress.schema.yml`` resolve without jsonschema
+    fetching them again, which it can only do for JSON documents.  The store
+    is shared by all validators built while the files are unchanged.
+    """
+
+    entries = tuple(
+        (str(path), path.stat().st_mtime_ns)
+        for path in sorted(schema_dir.resolve().glob("*.schema.yml"))
+    )
+    return _load_schema_store(entries)
+
+
+def _build_resolver(base_uri: str, schema: dict, store: dict[str, dict]) -> Any:
+    try:
+        return RefResolver(base_uri=base_uri, referrer=schema, store=store)
+    except TypeError:  # pragma: no cover - minimal RefResolver stand-ins
+        return RefResolver(base_uri=base_uri, referrer=schema)
+
+
 def build_validator(schema_path: Path, schema: dict) -> Draft202012Validator | int:
     base_uri = schema_path.resolve().as_uri()
     try:
-        resolver = RefResolver(base_uri=base_uri, referrer=schema)
+        resolver = _build_resolver(base_uri, schema, schema_store(schema_path.parent))
         return Draft202012Validator(schema, resolver=resolver)
     except Exception as exc:  # pragma: no cover - validation error details vary
         print(f"Schema validation failed: {exc}", file=sys.stderr)
         return 1
 
 
+@functools.lru_cache(maxsize=8)
+def _load_schema(path: str, mtime_ns: int, size: int) -> tuple[dict, object]:
+    schema_path = Path(path)
+    schema = load_yaml(schema_path)
+    return schema, build_validator(schema_path, schema)
+
+
 def validate_schema(schema_path: Path) -> tuple[dict, Draft202012Validator] | int:
-    if not schema_path.exists():
+    """Load *schema_path* and build its validator, reused while it is unchanged."""
+
+    try:
+        stat = schema_path.stat()
+    except FileNotFoundError:
         print(f"Schema file not found: {schema_path}", file=sys.stderr)
         return 1
 
     try:
-        schema = load_yaml(schema_path)
+        schema, validator = _load_schema(
+            str(schema_path.resolve()), stat.st_mtime_ns, stat.st_size
+        )
     except ValueError as exc:
         print(exc, file=sys.stderr)
         return 1
 
-    validator = build_validator(schema_path, schema)
     if isinstance(validator, int):  # pragma: no cover - failure already logged
+        _load_schema.cache_clear()
         return validator
 
     return schema, validator
 
 
-def validate_examples(validator: Draft202012Validator, examples_dir: Path) -> int:
-    schema = validator.schema
-    failures: list[str] = []
+@functools.lru_cache(maxsize=8)
+def _load_fast_check(path: str, mtime_ns: int, size: int) -> FastCheck | None:
+    schema, _ = _load_schema(path, mtime_ns, size)
+    return compile_check(schema, Path(path))
 
-    for example in sorted(examples_dir.glob("*.yml")):
-        try:
-            document = load_yaml(example)
-        except ValueError as exc:
-            failures.append(str(exc))
-            continue
 
+def schema_fast_check(schema_path: Path) -> FastCheck | None:
+    """Return the compiled fastjsonschema check for *schema_path*, if available."""
+
+    try:
+        stat = schema_path.stat()
+        return _load_fast_check(
+            str(schema_path.resolve()), stat.st_mtime_ns, stat.st_size
+        )
+    except (OSError, ValueError):  # pragma: no cover - reported by validate_schema
+        return None
+
+
+def _first_error(
+    validator: Draft202012Validator, fast_check: FastCheck | None, document: object
+) -> ValidationError | None:
+    # The compiled check only says yes or no; let jsonschema produce the error.
+    if fast_check is not None and fast_check(document):
+        return None
+
+    iter_errors = getattr(validator, "iter_errors", None)
+    if iter_errors is None:  # pragma: no cover - minimal jsonschema stand-ins
         try:
             validator.validate(document)
         except ValidationError as exc:
-            failures.append(f"{example}: {exc.message}")
-            continue
+            return exc
+        return None
+    # Stop at the first error; only its message is reported.
+    return next(iter_errors(document), None)
 
-        secrets = document.get("secrets", {})
-        placeholder_failures: list[str] = []
-        for secret in secrets.get("env", []) or []:
-            value = secret.get("value", "")
-            if isinstance(value, str) and value.lower().startswith("change-me"):
-                placeholder_failures.append(secret.get("name", "<unnamed>"))
-        for secret in secrets.get("files", []) or []:
-            raw_value = secret.get("value") or secret.get("content") or ""
-            if isinstance(raw_value, str) and raw_value.lower().startswith("change-me"):
-                placeholder_failures.append(secret.get("name", "<unnamed>"))
-        if placeholder_failures:
-            failures.append(
-                f"{example}: secrets {', '.join(sorted(placeholder_failures))} retain change-me placeholders"
-            )
 
-        if document.get("needs_container_runtime") is not True and document.get(
-            "service_container", {}
-        ).get("features"):
-            failures.append(f"{example}: {FEATURES_REQUIRE_RUNTIME_MESSAGE}")
+def _check_example(
+    example: Path, validator: Draft202012Validator, fast_check: FastCheck | None
+) -> list[str]:
+    try:
+        document = load_yaml(example)
+    except ValueError as exc:
+        return [str(exc)]
+
+    error = _first_error(validator, fast_check, document)
+    if error is not None:
+        return [f"{example}: {error.message}"]
 
+    failures: list[str] = []
+    secrets = document.get("secrets", {})
+    placeholder_failures: list[str] = []
+    for secret in secrets.get("env", []) or []:
+        value = secret.get("value", "")
+        if isinstance(value, str) and _CHANGE_ME_RE.match(value):
+            placeholder_failures.append(secret.get("name", "<unnamed>"))
+    for secret in secrets.get("files", []) or []:
+        raw_value = secret.get("value") or secret.get("content") or ""
+        if isinstance(raw_value, str) and _CHANGE_ME_RE.match(raw_value):
+            placeholder_failures.append(secret.get("name", "<unnamed>"))
+    if placeholder_failures:
+        failures.append(
+            f"{example}: secrets {', '.join(sorted(placeholder_failures))} retain change-me placeholders"
+        )
+
+    if document.get("needs_container_runtime") is not True and document.get(
+        "service_container", {}
+    ).get("features"):
+        failures.append(f"{example}: {FEATURES_REQUIRE_RUNTIME_MESSAGE}")
+
+    return failures
+
+
+def validate_examples(
+    validator: Draft202012Validator,
+    examples_dir: Path,
+    *,
+    fast_check: FastCheck | None = None,
+) -> int:
+    """Validate every ``*.yml`` example in *examples_dir*."""
+
+    # scandir reports file types from the directory listing itself, avoiding
+    # pathlib's per-entry glob matching and Path construction.
+    with os.scandir(examples_dir) as entries:
+        examples = [
+            Path(path)
+            for path in sorted(
+                entry.path
+                for entry in entries
+                if entry.name.endswith(".yml") and entry.is_file()
+            )
+        ]
+    results = [_check_example(example, validator, fast_check) for example in examples]
+
+    failures = [failure for result in results for failure in result]
     if failures:
         for failure in failures:
             print(failure, file=sys.stderr)
@@ -132,6 +247,9 @@ def main() -> int:
             return registry_schema_validation
 
         _, registry_validator = registry_schema_validation
+        registry_fast_check = schema_fast_check(
+            Path("schemas/dependency-registry.schema.yml")
+        )
         registry_failures: list[str] = []
         for registry_path in args.dependency_registry:
             if not registry_path.exists():
@@ -144,10 +262,11 @@ def main() -> int:
             except ValueError as exc:
                 registry_failures.append(str(exc))
                 continue
-            try:
-                registry_validator.validate(registry_document)
-            except ValidationError as exc:
-                registry_failures.append(f"{registry_path}: {exc.message}")
+            error = _first_error(
+                registry_validator, registry_fast_check, registry_document
+            )
+            if error is not None:
+                registry_failures.append(f"{registry_path}: {error.message}")
 
         if registry_failures:
             for failure in registry_failures:
@@ -164,7 +283,9 @@ def main() -> int:
         if not examples_dir.exists():
             print(f"Examples directory not found: {examples_dir}", file=sys.stderr)
             return 1
-        result = validate_examples(validator, examples_dir)
+        result = validate_examples(
+            validator, examples_dir, fast_check=schema_fast_check(schema_path)
+        )
         if result != 0:
             return result
         print(f"Validated examples in {examples_dir}.")
@@ -3,45 +3,60 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import re
 import sys
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Dict, FrozenSet, Iterable, List
 
 if __package__ in {None, ""}:  # pragma: no cover - CLI fallback
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-    import yaml
+    from ci.yaml_loader import safe_load
 else:  # pragma: no cover - package import
-    import yaml
+    from .yaml_loader import safe_load
 
 DEFAULT_APPLY_TARGETS = ["docker", "podman", "kubernetes", "proxmox", "baremetal"]
 
+SERVICE_DIRECTIVES = frozenset(
+    {b"ProtectSystem", b"ProtectHome", b"TemporaryFileSystem"}
+)
 
-def parse_unit(unit_path: Path) -> Dict[str, Dict[str, List[str]]]:
-    sections: Dict[str, Dict[str, List[str]]] = {}
-    current_section: str | None = None
 
-    for raw_line in unit_path.read_text(encoding="utf-8").splitlines():
-        line = raw_line.strip()
-        if not line or line.startswith("#") or line.startswith(";"):
-            continue
-        if line.startswith("[") and line.endswith("]"):
-            current_section = line[1:-1]
-            sections.setdefault(current_section, {})
-            continue
-        if "=" not in raw_line or current_section is None:
-            continue
-        key, value = raw_line.split("=", 1)
-        key = key.strip()
-        value = value.strip()
-        section_entries = sections.setdefault(current_section, {})
-        section_entries.setdefault(key, []).append(value)
+@functools.lru_cache(maxsize=8)
+def _directive_re(keys: FrozenSet[bytes]) -> re.Pattern[bytes]:
+    names = b"|".join(re.escape(key) for key in sorted(keys))
+    return re.compile(
+        rb"^[ \t]*(?:\[([^\n]*)\]|(" + names + rb")[ \t]*=[ \t]*([^\n]*?))[ \t]*\r?$",
+        re.MULTILINE,
+    )
+
+
+def scan_service_directives(
+    unit_bytes: bytes, keys: FrozenSet[bytes] = SERVICE_DIRECTIVES
+) -> Dict[str, List[str]] | None:
+    r"""Collect the *keys* directives of the ``[Service]`` section in one scan.
+
+    systemd units allow repeated keys, so each directive maps to the list of
+    its values in file order; comments and other sections are ignored. Lines
+    end at ``\n`` (a trailing ``\r`` is dropped), as systemd reads them.
+    Returns ``None`` when the unit has no ``[Service]`` section.
+    """
 
-    return sections
+    directives: Dict[str, List[str]] | None = None
+    in_service = False
+    for section, key, value in _directive_re(keys).findall(unit_bytes):
+        if not key:
+            in_service = section == b"Service"
+            if in_service and directives is None:
+                directives = {}
+        elif in_service:
+            directives.setdefault(key.decode("utf-8"), []).append(value.decode("utf-8"))
+    return directives
 
 
 def load_service_definition(path: Path) -> dict:
-    with path.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle)
+    with path.open("rb") as handle:
+        return safe_load(handle)
 
 
 def enforce_protect_system(service: dict) -> bool:
@@ -85,8 +100,7 @@ def ephemeral_paths_for_baremetal(service: dict) -> List[str]:
 
 def validate_unit(unit_path: Path, service_path: Path) -> int:
     service = load_service_definition(service_path)
-    unit_sections = parse_unit(unit_path)
-    service_section = unit_sections.get("Service")
+    service_section = scan_service_directives(unit_path.read_bytes())
 
     errors: List[str] = []
     if service_section is None:
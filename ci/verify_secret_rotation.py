@@ -3,51 +3,50 @@ from __future__ import annotations
 import argparse
 import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional accelerator
+    orjson = None
+
 ROTATION_ANNOTATION = "shma.dev/secrets-rotation"
 
 
-def run_kubectl(args: List[str]) -> subprocess.CompletedProcess[str]:
+def run_kubectl(args: List[str], *, text: bool = True) -> subprocess.CompletedProcess:
+    """Run kubectl with *args*; ``text=False`` captures the output as bytes."""
+
     return subprocess.run(
         ["kubectl", *args],
         capture_output=True,
-        text=True,
+        text=text,
         check=True,
     )
 
 
-def get_deployment(namespace: str, deployment: str) -> dict:
-    result = run_kubectl(
-        [
-            "get",
-            "deployment",
-            deployment,
-            "-n",
-            namespace,
-            "-o",
-            "json",
-        ]
-    )
+def kubectl_json(args: List[str]) -> dict:
+    # Parse the raw bytes; both parsers decode UTF-8 themselves, so there is
+    # no need for subprocess to build an intermediate str.
+    result = run_kubectl([*args, "-o", "json"], text=False)
+    if orjson is not None:
+        return orjson.loads(result.stdout)
     return json.loads(result.stdout)
 
 
+def get_deployment(namespace: str, deployment: str) -> dict:
+    return kubectl_json(["get", "deployment", deployment, "-n", namespace])
+
+
+def get_pods(namespace: str, label_selector: str) -> dict[str, dict]:
+    """Return the full pod objects matching *label_selector*, keyed by name."""
+
+    payload = kubectl_json(["get", "pods", "-n", namespace, "-l", label_selector])
+    return {item["metadata"]["name"]: item for item in payload.get("items", [])}
+
+
 def get_pod_names(namespace: str, label_selector: str) -> list[str]:
-    result = run_kubectl(
-        [
-            "get",
-            "pods",
-            "-n",
-            namespace,
-            "-l",
-            label_selector,
-            "-o",
-            "json",
-        ]
-    )
-    payload = json.loads(result.stdout)
-    items = payload.get("items", [])
-    return sorted(item["metadata"]["name"] for item in items)
+    return sorted(get_pods(namespace, label_selector))
 
 
 def annotate_rotation(namespace: str, deployment: str, timestamp: str) -> None:
@@ -78,19 +77,12 @@ def wait_for_rollout(namespace: str, deployment: str, timeout: str) -> None:
     )
 
 
-def validate_rotation_env(namespace: str, pod_name: str, timestamp: str) -> None:
-    result = run_kubectl(
-        [
-            "get",
-            "pod",
-            pod_name,
-            "-n",
-            namespace,
-            "-o",
-            "json",
-        ]
-    )
-    payload = json.loads(result.stdout)
+def validate_rotation_env(
+    namespace: str, pod_name: str, timestamp: str, pod: dict | None = None
+) -> None:
+    payload = pod
+    if payload is None:
+        payload = kubectl_json(["get", "pod", pod_name, "-n", namespace])
     containers = payload.get("spec", {}).get("containers", [])
     if not containers:
         raise SystemExit(f"Pod {pod_name} has no containers to inspect.")
@@ -115,7 +107,13 @@ def ensure_secret_rotation(
     label_selector: str | None,
 ) -> None:
     selector = label_selector or f"app={deployment}"
-    deployment_doc = get_deployment(namespace, deployment)
+    # The deployment and its pods are independent reads; fetch them together.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        deployment_future = executor.submit(get_deployment, namespace, deployment)
+        pods_future = executor.submit(get_pod_names, namespace, selector)
+        deployment_doc = deployment_future.result()
+        initial_pods = pods_future.result()
+
     current_annotation = (
         deployment_doc.get("spec", {})
         .get("template", {})
@@ -129,7 +127,6 @@ def ensure_secret_rotation(
             f"Deployment {deployment} already has {ROTATION_ANNOTATION}={timestamp}; provide a new timestamp to trigger rotation."
         )
 
-    initial_pods = get_pod_names(namespace, selector)
     if not initial_pods:
         raise SystemExit(
             f"No pods found for deployment {deployment} using selector {selector}."
@@ -138,7 +135,10 @@ def ensure_secret_rotation(
     annotate_rotation(namespace, deployment, timestamp)
     wait_for_rollout(namespace, deployment, timeout)
 
-    refreshed_pods = get_pod_names(namespace, selector)
+    # The pod list already carries each pod's spec, so the new pod's
+    # environment is checked without another ``kubectl get pod``.
+    pods = get_pods(namespace, selector)
+    refreshed_pods = sorted(pods)
     if not refreshed_pods:
         raise SystemExit("No pods found after applying the rotation annotation.")
 
@@ -147,7 +147,9 @@ def ensure_secret_rotation(
             "Secret rotation annotation did not trigger a new ReplicaSet; pod names are unchanged."
         )
 
-    validate_rotation_env(namespace, refreshed_pods[0], timestamp)
+    validate_rotation_env(
+        namespace, refreshed_pods[0], timestamp, pod=pods[refreshed_pods[0]]
+    )
 
 
 def parse_args() -> argparse.Namespace:
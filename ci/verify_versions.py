@@ -2,25 +2,32 @@
 """Assert that toolchain versions stay within the documented compatibility matrix."""
 from __future__ import annotations
 
+import functools
 import json
 import os
-import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version as distribution_version
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, List
 
 MATRIX_PATH = Path("ci/version_matrix.yml")
 OFFLINE_FLAG = "CI_BOOTSTRAP_OFFLINE"
+_ANSIBLE_CORE_MARKER = "ansible [core "
 
 
 def _offline_mode() -> bool:
     return bool(os.environ.get(OFFLINE_FLAG))
 
 
+@functools.lru_cache(maxsize=1)
 def load_matrix() -> Dict[str, object]:
     try:
-        return json.loads(MATRIX_PATH.read_text(encoding="utf-8"))
+        # json decodes the UTF-8 bytes itself; no intermediate str is needed.
+        with MATRIX_PATH.open("rb") as handle:
+            return json.load(handle)
     except json.JSONDecodeError as exc:  # pragma: no cover - defensive guard
         raise RuntimeError(f"Failed to parse version matrix: {exc}") from exc
 
@@ -28,12 +35,13 @@ def load_matrix() -> Dict[str, object]:
 MATRIX = load_matrix()
 
 
-def _python_prefixes() -> List[str]:
+@functools.lru_cache(maxsize=1)
+def _python_prefixes() -> tuple[str, ...]:
     prefixes = []
     python_section = MATRIX.get("python", {})
 
     if not isinstance(python_section, dict):
-        return prefixes
+        return ()
 
     if "prefix" in python_section:
         prefixes.append(str(python_section["prefix"]))
@@ -42,7 +50,60 @@ def _python_prefixes() -> List[str]:
         if isinstance(value, dict) and "prefix" in value:
             prefixes.append(str(value["prefix"]))
 
-    return sorted(set(prefixes))
+    return tuple(sorted(set(prefixes)))
+
+
+# The matrix entries below are resolved on first use and then reused by every
+# check.  Resolving them at import would turn a missing entry into a KeyError
+# before offline mode or the CLI could report anything.
+@functools.lru_cache(maxsize=None)
+def _matrix_entry(section: str, key: str) -> str:
+    entries = MATRIX.get(section)
+    if not isinstance(entries, dict) or key not in entries:
+        raise RuntimeError(f"{MATRIX_PATH} does not define {section}.{key}.")
+    return str(entries[key])
+
+
+@functools.lru_cache(maxsize=1)
+def _kubectl_versions() -> tuple[frozenset[str], str]:
+    """Return the allowed kubectl versions and their display string."""
+
+    versions = frozenset(
+        {_matrix_entry("kubectl", "stable"), _matrix_entry("kubectl", "latest")}
+    )
+    return versions, ", ".join(sorted(versions))
+
+
+def _ansible_core_version(output: str) -> str | None:
+    """Return X.Y.Z from the ``ansible [core X.Y.Z]`` line of ``ansible --version``."""
+
+    start = output.find(_ANSIBLE_CORE_MARKER)
+    if start == -1:
+        return None
+    start += len(_ANSIBLE_CORE_MARKER)
+    end = output.find("]", start)
+    version = output[start:end] if end != -1 else ""
+    if not version or version.strip("0123456789."):
+        return None
+    return version
+
+
+def _ansible_core_version_from_cli(errors: List[str]) -> str | None:
+    try:
+        ansible_out = run_command(["ansible", "--version"])
+    except subprocess.CalledProcessError as exc:  # pragma: no cover - defensive guard
+        errors.append("Unable to execute ansible --version: " + exc.stderr.strip())
+        return None
+    except FileNotFoundError:  # pragma: no cover - defensive guard
+        errors.append("ansible binary not found in PATH.")
+        return None
+
+    version = _ansible_core_version(ansible_out.stdout)
+    if version is None:
+        errors.append(
+            "ansible --version output did not contain a core version identifier."
+        )
+    return version
 
 
 def run_command(command: List[str]) -> subprocess.CompletedProcess[str]:
@@ -56,7 +117,7 @@ def check_python() -> List[str]:
         return []
     version = sys.version.split()[0]
     prefixes = _python_prefixes()
-    if prefixes and not any(version.startswith(prefix) for prefix in prefixes):
+    if prefixes and not version.startswith(prefixes):
         allowed = ", ".join(prefixes)
         return [
             "Python " f"{version} is outside the supported version prefixes: {allowed}."
@@ -69,47 +130,40 @@ def check_ansible() -> List[str]:
         return []
     errors: List[str] = []
 
+    # Read the installed distribution's metadata in-process; this is what
+    # ``python -m pip show ansible`` reports, without starting pip.
     try:
-        pip_info = run_command([sys.executable, "-m", "pip", "show", "ansible"])
-    except subprocess.CalledProcessError as exc:  # pragma: no cover - defensive guard
+        version = distribution_version("ansible")
+    except PackageNotFoundError:
         errors.append(
-            "Unable to determine ansible version via pip: " + exc.stderr.strip()
+            "Unable to determine ansible version: the ansible package is not installed."
         )
     else:
-        version_match = re.search(
-            r"^Version:\s*(?P<version>\S+)$", pip_info.stdout, re.MULTILINE
-        )
-        if not version_match:
+        if not version:
             errors.append("ansible package version could not be parsed.")
         else:
-            version = version_match.group("version")
-            expected_prefix = str(MATRIX["ansible"]["package_prefix"])
-            if not version.startswith(expected_prefix):
+            package_prefix = _matrix_entry("ansible", "package_prefix")
+            if not version.startswith(package_prefix):
                 errors.append(
-                    "Ansible package "
-                    f"{version} is outside the supported {expected_prefix} range."
+                    f"Ansible package {version} is outside the supported "
+                    f"{package_prefix} range."
                 )
 
+    # ansible-core is read the same way, without importing the ansible
+    # package; only shell out to ``ansible --version`` when it is installed
+    # outside this interpreter.
     try:
-        ansible_out = run_command(["ansible", "--version"])
-    except subprocess.CalledProcessError as exc:  # pragma: no cover - defensive guard
-        errors.append("Unable to execute ansible --version: " + exc.stderr.strip())
-    except FileNotFoundError:  # pragma: no cover - defensive guard
-        errors.append("ansible binary not found in PATH.")
-    else:
-        match = re.search(r"ansible \[core (?P<version>[\d.]+)\]", ansible_out.stdout)
-        if not match:
+        core_version = distribution_version("ansible-core")
+    except PackageNotFoundError:
+        core_version = _ansible_core_version_from_cli(errors)
+
+    if core_version is not None:
+        core_prefix = _matrix_entry("ansible", "core_prefix")
+        if not core_version.startswith(core_prefix):
             errors.append(
-                "ansible --version output did not contain a core version identifier."
+                "ansible-core "
+                f"{core_version} is outside the supported {core_prefix} range."
             )
-        else:
-            version = match.group("version")
-            expected_prefix = str(MATRIX["ansible"]["core_prefix"])
-            if not version.startswith(expected_prefix):
-                errors.append(
-                    "ansible-core "
-                    f"{version} is outside the supported {expected_prefix} range."
-                )
 
     return errors
 
@@ -140,14 +194,11 @@ def check_kubectl() -> List[str]:
             "kubectl clientVersion.gitVersion was missing from the JSON payload."
         )
     else:
-        allowed_versions = {
-            str(MATRIX["kubectl"]["stable"]),
-            str(MATRIX["kubectl"]["latest"]),
-        }
+        allowed_versions, allowed_display = _kubectl_versions()
         if git_version not in allowed_versions:
-            allowed = ", ".join(sorted(allowed_versions))
             errors.append(
-                f"kubectl {git_version} is outside the supported set: {allowed}."
+                f"kubectl {git_version} is outside the supported set: "
+                f"{allowed_display}."
             )
 
     return errors
@@ -156,13 +207,24 @@ def check_kubectl() -> List[str]:
 CHECKS = (check_python, check_ansible, check_kubectl)
 
 
+def _run_check(check: Callable[[], List[str]]) -> List[str]:
+    # A matrix missing an entry a check needs is reported like any failure.
+    try:
+        return check()
+    except RuntimeError as exc:
+        return [str(exc)]
+
+
 def main() -> int:
     if _offline_mode():
         print("Skipping toolchain version verification in offline mode.")
         return 0
     failures: List[str] = []
-    for check in CHECKS:
-        failures.extend(check())
+    # The checks are independent and mostly wait on subprocesses; run them
+    # together but report failures in CHECKS order.
+    with ThreadPoolExecutor(max_workers=len(CHECKS)) as executor:
+        for check_failures in executor.map(_run_check, CHECKS):
+            failures.extend(check_failures)
 
     if failures:
         for failure in failures:
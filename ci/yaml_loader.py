@@ -0,0 +1,99 @@
+"""YAML loading helpers shared by the CI scripts."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import IO, Any, Iterator, Union
+
+import yaml
+
+# PyYAML's ``safe_load`` always uses the pure-Python SafeLoader; prefer the
+# libyaml-backed loader when the C extension is available.  The bundled
+# fallback parser exposes neither class and is used through ``safe_load``.
+_LOADER = getattr(yaml, "CSafeLoader", None) or getattr(yaml, "SafeLoader", None)
+
+CACHE_DIR_ENV = "SHMA_CI_CACHE_DIR"
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "shma-ci"
+
+Stream = Union[str, bytes, IO[str], IO[bytes]]
+
+
+def safe_load(stream: Stream) -> Any:
+    """Parse the first YAML document in *stream* using the fastest safe loader."""
+
+    if _LOADER is None:
+        return yaml.safe_load(stream)
+    return yaml.load(stream, Loader=_LOADER)
+
+
+def safe_load_all(stream: Stream) -> Iterator[Any]:
+    """Parse every YAML document in *stream* using the fastest safe loader."""
+
+    if _LOADER is None:
+        return yaml.safe_load_all(stream)
+    return yaml.load_all(stream, Loader=_LOADER)
+
+
+def cache_root() -> Path:
+    """Return the directory CI helpers persist cross-run caches under."""
+
+    override = os.environ.get(CACHE_DIR_ENV)
+    return Path(override) if override else DEFAULT_CACHE_DIR
+
+
+def _cache_dir() -> Path:
+    return cache_root() / "yaml"
+
+
+def _cache_key(path: Path) -> str:
+    stat = path.stat()
+    loader = _LOADER.__name__ if _LOADER is not None else "fallback"
+    identity = f"{path.resolve()}\0{stat.st_mtime_ns}\0{stat.st_size}\0{loader}"
+    return hashlib.blake2b(identity.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def cached_load(path: Path) -> Any:
+    """Parse the YAML file at *path*, reusing the result of an earlier run.
+
+    Parsed documents are pickled under ``$SHMA_CI_CACHE_DIR/yaml`` (default
+    ``~/.cache/shma-ci/yaml``) keyed by the resolved path, modification time,
+    and size, so an unchanged file is only parsed once across CI invocations.
+    Cache failures are never fatal; the file is simply parsed again.
+    """
+
+    key = _cache_key(path)
+    cache_file = _cache_dir() / f"{key}.pkl"
+
+    try:
+        with cache_file.open("rb") as handle:
+            return pickle.load(handle)
+    except Exception:  # missing or corrupt entries are simply re-parsed
+        pass
+
+    with path.open("rb") as handle:
+        document = safe_load(handle)
+    _store(cache_file, document)
+    return document
+
+
+def _store(cache_file: Path, document: Any) -> None:
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+    except OSError:  # pragma: no cover - read-only cache directory
+        return
+
+    # Write to a private temporary file and rename so concurrent CI shards
+    # never observe a partially written entry.
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            pickle.dump(document, handle, protocol=5)
+        os.replace(tmp_name, cache_file)
+    except (OSError, pickle.PicklingError):  # pragma: no cover - best effort
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import functools
+import sys
 from collections.abc import Iterable
 from typing import Any
 
+_OPTIONAL_REQ_FIELDS = ("version", "exports_hash")
+_OPTIONAL_DEP_FIELDS = ("version", "exports_hash", "exports")
+
 
 class RegistryFormatError(ValueError):
     """Raised when a registry fragment does not match the expected format."""
@@ -18,26 +23,33 @@ def _ensure_mapping(value: Any, context: str) -> dict[str, Any]:
     )
 
 
+def _intern_name(name: Any) -> Any:
+    # Names are hashed repeatedly as dict keys and set members while merging
+    # and walking the graph; interning lets equal names share one object.
+    # sys.intern() rejects str subclasses such as Ansible's unsafe text.
+    return sys.intern(name) if type(name) is str else name
+
+
 def _normalize_requirement(item: Any) -> dict[str, Any]:
     """Normalize a dependency requirement entry into a canonical mapping."""
     if isinstance(item, str):
-        return {"name": item}
+        return {"name": _intern_name(item)}
     if isinstance(item, dict):
         if "name" in item and isinstance(item["name"], str):
-            normalized = {"name": item["name"]}
-            if item.get("version") is not None:
-                normalized["version"] = item["version"]
-            if item.get("exports_hash") is not None:
-                normalized["exports_hash"] = item["exports_hash"]
+            normalized = {"name": _intern_name(item["name"])}
+            for key in _OPTIONAL_REQ_FIELDS:
+                value = item.get(key)
+                if value is not None:
+                    normalized[key] = value
             return normalized
         if len(item) == 1:
             key, value = next(iter(item.items()))
             if isinstance(value, dict):
-                normalized = {"name": key}
-                if value.get("version") is not None:
-                    normalized["version"] = value["version"]
-                if value.get("exports_hash") is not None:
-                    normalized["exports_hash"] = value["exports_hash"]
+                normalized = {"name": _intern_name(key)}
+                for field in _OPTIONAL_REQ_FIELDS:
+                    field_value = value.get(field)
+                    if field_value is not None:
+                        normalized[field] = field_value
                 return normalized
     raise ValueError(f"Unsupported requirement entry: {item!r}")
 
@@ -49,12 +61,12 @@ def normalize_requirements(requirements: Any) -> list[dict[str, Any]]:
     if isinstance(requirements, dict):
         normalized: list[dict[str, Any]] = []
         for name, meta in requirements.items():
-            entry = {"name": name}
+            entry = {"name": _intern_name(name)}
             if isinstance(meta, dict):
-                if meta.get("version") is not None:
-                    entry["version"] = meta["version"]
-                if meta.get("exports_hash") is not None:
-                    entry["exports_hash"] = meta["exports_hash"]
+                for key in _OPTIONAL_REQ_FIELDS:
+                    value = meta.get(key)
+                    if value is not None:
+                        entry[key] = value
             normalized.append(entry)
         return normalized
     if isinstance(requirements, Iterable) and not isinstance(
@@ -79,28 +91,33 @@ def normalize_dependency_registry(registry: Any) -> dict[str, dict[str, Any]]:
             f"Received {type(source).__name__}: {source!r}."
         )
 
-    normalized: dict[str, dict[str, Any]] = {}
-    for raw_name, raw_metadata in source.items():
-        if not isinstance(raw_name, str) or not raw_name:
-            raise RegistryFormatError(
-                "Dependency registry keys must be non-empty strings. "
-                f"Received key {raw_name!r}."
-            )
-
-        metadata = _ensure_mapping(
-            raw_metadata,
-            context=f"Dependency '{raw_name}' metadata",
+    return {
+        _intern_name(raw_name): _normalize_dependency_entry(raw_name, raw_metadata)
+        for raw_name, raw_metadata in source.items()
+    }
+
+
+def _normalize_dependency_entry(raw_name: Any, raw_metadata: Any) -> dict[str, Any]:
+    if not isinstance(raw_name, str) or not raw_name:
+        raise RegistryFormatError(
+            "Dependency registry keys must be non-empty strings. "
+            f"Received key {raw_name!r}."
         )
 
-        entry: dict[str, Any] = {}
-        for key in ("version", "exports_hash", "exports"):
-            if key in metadata and metadata[key] is not None:
-                entry[key] = metadata[key]
-        if "requires" in metadata and metadata["requires"] is not None:
-            entry["requires"] = normalize_requirements(metadata["requires"])
-        normalized[raw_name] = entry
+    metadata = _ensure_mapping(
+        raw_metadata,
+        context=f"Dependency '{raw_name}' metadata",
+    )
 
-    return normalized
+    entry: dict[str, Any] = {}
+    for key in _OPTIONAL_DEP_FIELDS:
+        value = metadata.get(key)
+        if value is not None:
+            entry[key] = value
+    requires = metadata.get("requires")
+    if requires is not None:
+        entry["requires"] = normalize_requirements(requires)
+    return entry
 
 
 def merge_dependency_registries(registries: Iterable[Any]) -> dict[str, dict[str, Any]]:
@@ -114,6 +131,15 @@ def merge_dependency_registries(registries: Iterable[Any]) -> dict[str, dict[str
         normalized = normalize_dependency_registry(registry)
         for name, metadata in normalized.items():
             existing = result.get(name)
+            if existing is None:
+                # First fragment to mention this dependency: the normalized
+                # entry is freshly built, so adopt it instead of copying it
+                # key by key.  Only repeated requirements need collapsing.
+                if "requires" in metadata:
+                    metadata["requires"] = _merge_requirements([], metadata["requires"])
+                result[name] = metadata
+                continue
+
             if existing and "version" in metadata:
                 existing_version = existing.get("version")
                 new_version = metadata.get("version")
@@ -128,18 +154,13 @@ def merge_dependency_registries(registries: Iterable[Any]) -> dict[str, dict[str
                         f"incoming={new_version!r}."
                     )
 
-            merged = existing.copy() if existing else {}
-            for key, value in metadata.items():
-                if key == "requires":
-                    existing_requires = normalize_requirements(
-                        merged.get("requires", [])
-                    )
-                    new_requires = normalize_requirements(value)
-                    merged["requires"] = _merge_requirements(
-                        existing_requires, new_requires
-                    )
-                else:
-                    merged[key] = value
+            merged = existing | metadata
+            if "requires" in metadata:
+                # Both sides come from normalize_dependency_registry (or an
+                # earlier merge of its output) and are already canonical.
+                merged["requires"] = _merge_requirements(
+                    existing.get("requires", []), metadata["requires"]
+                )
             result[name] = merged
 
     return result
@@ -154,11 +175,13 @@ def _merge_requirements(
         if name not in merged:
             merged[name] = item
             continue
-        merged_item = merged[name].copy()
-        for key in ("version", "exports_hash"):
-            if item.get(key) is not None:
-                merged_item[key] = item[key]
-        merged[name] = merged_item
+        updates = {
+            key: value
+            for key in _OPTIONAL_REQ_FIELDS
+            if (value := item.get(key)) is not None
+        }
+        if updates:
+            merged[name] = merged[name] | updates
     return list(merged.values())
 
 
@@ -171,55 +194,91 @@ def dependency_graph_cycles(
         if isinstance(registry, dict)
         else normalize_dependency_registry(registry)
     )
-    graph: dict[str, list[str]] = {}
-
-    for name, metadata in normalized_registry.items():
-        requires = normalize_requirements(metadata.get("requires", []))
-        graph[name] = [item["name"] for item in requires if item.get("name")]
+    graph: dict[str, list[str]] = {
+        name: _requirement_names(metadata.get("requires", []))
+        for name, metadata in normalized_registry.items()
+    }
 
     if current_service:
-        requires = normalize_requirements(current_requires)
-        graph[current_service] = [item["name"] for item in requires if item.get("name")]
+        graph[current_service] = _requirement_names(current_requires)
         for req in graph[current_service]:
             graph.setdefault(req, [])
 
     return _find_cycles(graph)
 
 
+def _requirement_name(item: Any) -> Any:
+    """Return the dependency name :func:`_normalize_requirement` would emit."""
+    if isinstance(item, str):
+        return item
+    if isinstance(item, dict):
+        if "name" in item and isinstance(item["name"], str):
+            return item["name"]
+        if len(item) == 1:
+            key, value = next(iter(item.items()))
+            if isinstance(value, dict):
+                return key
+    raise ValueError(f"Unsupported requirement entry: {item!r}")
+
+
+def _requirement_names(requirements: Any) -> list[Any]:
+    """Return the non-empty names of *requirements* without normalizing them.
+
+    Cycle detection only needs the graph's adjacency lists, so this mirrors
+    :func:`normalize_requirements` but skips building the version and
+    ``exports_hash`` mappings.
+    """
+    if not requirements:
+        return []
+    if isinstance(requirements, dict):
+        return [name for name in requirements if name]
+    if isinstance(requirements, Iterable) and not isinstance(
+        requirements, (str, bytes)
+    ):
+        return [name for item in requirements if (name := _requirement_name(item))]
+    name = _requirement_name(requirements)
+    return [name] if name else []
+
+
 def _find_cycles(graph: dict[str, list[str]]) -> list[str]:
     cycles: set[tuple[str, ...]] = set()
-    stack: list[str] = []
-    visiting: set[str] = set()
     visited: set[str] = set()
 
-    def visit(node: str) -> None:
-        if node in visiting:
-            cycle = stack[stack.index(node) :] + [node]
-            cycles.add(_canonical_cycle(tuple(cycle)))
-            return
-        if node in visited:
-            return
-
-        visiting.add(node)
-        stack.append(node)
-        for neighbor in graph.get(node, []):
-            visit(neighbor)
-        stack.pop()
-        visiting.remove(node)
-        visited.add(node)
-
-    for node in graph.keys():
-        if node not in visited:
-            visit(node)
+    # Iterative depth-first search: ``path`` is the current DFS path,
+    # ``position`` maps each node on it to its index, and ``pending`` holds
+    # the unexplored neighbours of every node on the path.
+    for root in graph:
+        if root in visited:
+            continue
+        path = [root]
+        position = {root: 0}
+        pending = [iter(graph.get(root, ()))]
+        while pending:
+            neighbor = next(pending[-1], None)
+            if neighbor is None:
+                pending.pop()
+                node = path.pop()
+                del position[node]
+                visited.add(node)
+            elif neighbor in position:
+                cycle = (*path[position[neighbor] :], neighbor)
+                cycles.add(_canonical_cycle(cycle))
+            elif neighbor not in visited:
+                position[neighbor] = len(path)
+                path.append(neighbor)
+                pending.append(iter(graph.get(neighbor, ())))
 
     return [" -> ".join(cycle + (cycle[0],)) for cycle in sorted(cycles)]
 
 
+# The filter runs once per service against the same registry, so the same
+# cycles are canonicalized again and again across a play.
+@functools.lru_cache(maxsize=1024)
 def _canonical_cycle(cycle: tuple[str, ...]) -> tuple[str, ...]:
     if not cycle:
         return cycle
     unique = cycle[:-1]
-    min_index = min(range(len(unique)), key=lambda i: unique[i])
+    min_index = unique.index(min(unique))
     rotated = unique[min_index:] + unique[:min_index]
     return tuple(rotated)
 
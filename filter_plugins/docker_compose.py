@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-import copy
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence
 
 from ansible.errors import AnsibleFilterError
 
@@ -11,14 +10,13 @@ from .runtime_common import _as_list, _unique, compose_environment, ensure_env_e
 
 
 def _validate_apparmor_profile(
-    profile: str, allowed_profiles: Iterable[str], service_name: str
+    profile: str, allowed: FrozenSet[str], service_name: str
 ) -> None:
     profile = profile.strip()
     if not profile:
         raise AnsibleFilterError(
             f"service {service_name!r} apparmor profile must be a non-empty string"
         )
-    allowed = {item.strip() for item in allowed_profiles if item}
     if allowed and profile not in allowed:
         raise AnsibleFilterError(
             f"service {service_name!r} apparmor profile {profile!r} is not permitted; "
@@ -36,8 +34,12 @@ def docker_compose_prepare_services(
     drop_caps_default = _as_list(defaults.get("cap_drop_default"))
     no_new_privs = defaults.get("no_new_privs", True)
     default_apparmor = defaults.get("default_apparmor")
-    allowed_apparmor_profiles = _as_list(
-        defaults.get("allowed_apparmor_profiles", ["docker-default"])
+    allowed_apparmor = frozenset(
+        item.strip()
+        for item in _as_list(
+            defaults.get("allowed_apparmor_profiles", ["docker-default"])
+        )
+        if item
     )
     docker_tmpfs_defaults = _as_list(defaults.get("docker_tmpfs"))
     secret_env_default = ensure_env_entries(
@@ -52,7 +54,9 @@ def docker_compose_prepare_services(
     prepared: List[Dict[str, Any]] = []
 
     for service in services:
-        svc = copy.deepcopy(service)
+        # Only top-level keys are added below; nested values are read, never
+        # mutated, so a shallow copy keeps the input untouched.
+        svc = dict(service)
         service_name = svc.get("name") or svc.get("container_name")
         if not service_name:
             raise AnsibleFilterError(
@@ -67,30 +71,28 @@ def docker_compose_prepare_services(
         else:
             svc_cap_drop = _as_list(svc_cap_drop)
 
-        security_opts_input = _as_list(svc.get("security_opt"))
-        security_opts: List[str] = []
+        # An insertion-ordered dict acts as an ordered set: re-adding an
+        # option keeps its first position, so no membership checks are needed.
+        security_opts: Dict[str, None] = {}
         has_apparmor = False
-        for opt in security_opts_input:
+        for opt in _as_list(svc.get("security_opt")):
             opt_str = str(opt)
             if opt_str.startswith("apparmor="):
                 has_apparmor = True
                 _validate_apparmor_profile(
-                    opt_str.split("=", 1)[1], allowed_apparmor_profiles, service_name
+                    opt_str.split("=", 1)[1], allowed_apparmor, service_name
                 )
-            if opt_str not in security_opts:
-                security_opts.append(opt_str)
+            security_opts[opt_str] = None
 
-        if no_new_privs and "no-new-privileges:true" not in security_opts:
-            security_opts.append("no-new-privileges:true")
+        if no_new_privs:
+            security_opts["no-new-privileges:true"] = None
 
         svc_apparmor = svc.get("apparmor_profile", default_apparmor)
         if svc_apparmor not in (None, ""):
             _validate_apparmor_profile(
-                str(svc_apparmor), allowed_apparmor_profiles, service_name
+                str(svc_apparmor), allowed_apparmor, service_name
             )
-            apparmor_opt = f"apparmor={svc_apparmor}"
-            if apparmor_opt not in security_opts:
-                security_opts.append(apparmor_opt)
+            security_opts[f"apparmor={svc_apparmor}"] = None
             has_apparmor = True
 
         if not has_apparmor:
@@ -102,13 +104,15 @@ def docker_compose_prepare_services(
 
         svc_env_file = _unique(_as_list(svc.get("env_file")))
 
-        svc_secret_env = ensure_env_entries(
-            svc.get("secret_env", secret_env_default), context="secret_env"
-        )
-        inline_env = ensure_env_entries(svc.get("env", []), context="environment")
+        # secret_env_default is normalized once above and only read afterwards;
+        # compose_environment normalizes the inline environment itself.
+        if "secret_env" in svc:
+            svc_secret_env = ensure_env_entries(svc["secret_env"], context="secret_env")
+        else:
+            svc_secret_env = secret_env_default
 
         environment = compose_environment(
-            inline_env,
+            svc.get("env", []),
             svc_secret_env,
             rotation_timestamp=rotation_timestamp,
             service_name=svc.get("name", service_name),
@@ -127,7 +131,7 @@ def docker_compose_prepare_services(
                 "render_user": svc_user,
                 "render_read_only": svc_read_only,
                 "render_cap_drop": svc_cap_drop,
-                "render_security_opt": security_opts,
+                "render_security_opt": list(security_opts),
                 "render_tmpfs": svc_tmpfs,
                 "render_env_files": svc_env_file,
                 "render_environment": environment,
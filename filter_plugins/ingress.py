@@ -2,23 +2,31 @@
 
 from __future__ import annotations
 
+import functools
+import re
+
 from ansible.errors import AnsibleFilterError
 
 
 REQUIRED_EXPORT_KEYS = ("APP_FQDN", "APP_PORT", "APP_BACKEND_IP")
 
+# The line boundaries recognised by str.splitlines().
+_LINE_BREAKS = "\n\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029"
+# Matches every line that is neither blank nor a comment; group 1 starts at
+# the first non-blank character.
+_ENV_LINE = re.compile(
+    rf"(?:\A|(?<=[{_LINE_BREAKS}]))[^\S{_LINE_BREAKS}]*([^\s#][^{_LINE_BREAKS}]*)"
+)
+
 
 def _parse_env(content: str) -> dict[str, str]:
     exports: dict[str, str] = {}
-    for raw_line in content.splitlines():
-        line = raw_line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" not in line:
+    for match in _ENV_LINE.finditer(content):
+        key, separator, value = match[1].partition("=")
+        if not separator:
             raise AnsibleFilterError(
-                f"invalid exports line '{raw_line}'; expected KEY=VALUE"
+                f"invalid exports line '{match[0]}'; expected KEY=VALUE"
             )
-        key, value = line.split("=", 1)
         exports[key.strip()] = value.strip()
     return exports
 
@@ -49,8 +57,18 @@ def parse_ingress_exports(
         omitted the default ingress export keys are enforced.
     """
 
-    exports = _parse_env(content)
-    return _validate_ingress_exports(exports, required_keys)
+    keys = tuple(required_keys) if required_keys else REQUIRED_EXPORT_KEYS
+    return dict(_parse_and_validate(content, keys))
+
+
+# Templates re-run the filter with the same file contents many times per play;
+# the parsed pairs are cached and callers get a fresh dict each time.
+@functools.lru_cache(maxsize=128)
+def _parse_and_validate(
+    content: str, required_keys: tuple[str, ...]
+) -> tuple[tuple[str, str], ...]:
+    exports = _validate_ingress_exports(_parse_env(content), required_keys)
+    return tuple(exports.items())
 
 
 def validate_ingress_exports(
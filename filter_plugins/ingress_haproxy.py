@@ -2,7 +2,17 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Sequence
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    MutableMapping,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 from ansible.errors import AnsibleFilterError
 
@@ -21,18 +31,17 @@ def _ensure_mapping(
 
 def _normalize_binds(binds: Iterable[Mapping[str, Any]] | None) -> List[Dict[str, Any]]:
     normalized: List[Dict[str, Any]] = []
+    seen: Set[Tuple[str, str, bool]] = set()
     for bind in binds or []:
         address = str(bind.get("address", ""))
         port = str(bind.get("port", ""))
         if not address or not port:
             continue
-        entry = {
-            "address": address,
-            "port": port,
-            "tls": bool(bind.get("tls")),
-        }
-        if entry not in normalized:
-            normalized.append(entry)
+        key = (address, port, bool(bind.get("tls")))
+        if key in seen:
+            continue
+        seen.add(key)
+        normalized.append({"address": address, "port": port, "tls": key[2]})
     return normalized
 
 
@@ -77,6 +86,112 @@ def _normalize_backend(backend: Mapping[str, Any]) -> Dict[str, Any]:
     }
 
 
+Payload = Tuple[Dict[str, Any], Dict[str, Any]]
+
+
+def _pfsense_binds(normalized_binds: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [
+        {"address": bind["address"], "port": bind["port"], "ssl": bind["tls"]}
+        for bind in normalized_binds
+    ]
+
+
+def _build_pfsense(
+    backend: Mapping[str, Any],
+    check_path: str,
+    frontend_binds: List[Dict[str, Any]],
+    certificate_ref: str | None,
+) -> Payload:
+    service_id = backend["service_id"]
+    provider_backend = {
+        "name": service_id,
+        "balance": "roundrobin",
+        "health_check_enabled": True,
+        "health_check_method": "GET",
+        "health_check_path": check_path,
+        "servers": [
+            {
+                "name": f"{service_id}-primary",
+                "address": backend["backend_ip"],
+                "port": backend["backend_port"],
+                "ssl": backend["scheme"].lower() == "https",
+            }
+        ],
+    }
+
+    rules: List[MutableMapping[str, Any]] = [{"type": "host", "value": backend["host"]}]
+    if backend["path_prefix"] != "/":
+        rules.append({"type": "path_beg", "value": backend["path_prefix"]})
+
+    provider_frontend = {
+        "name": backend["router_name"],
+        "listen_addresses": frontend_binds,
+        "rules": rules,
+        "default_backend": service_id,
+        "tls_enabled": backend["tls_enabled"],
+        "tls_certificate_ref": certificate_ref or "",
+    }
+    return provider_backend, provider_frontend
+
+
+def _opnsense_binds(normalized_binds: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "address": bind["address"],
+            "port": bind["port"],
+            "ssl": "true" if bind["tls"] else "false",
+        }
+        for bind in normalized_binds
+    ]
+
+
+def _build_opnsense(
+    backend: Mapping[str, Any],
+    check_path: str,
+    frontend_binds: List[Dict[str, Any]],
+    certificate_ref: str | None,
+) -> Payload:
+    service_id = backend["service_id"]
+    provider_backend = {
+        "name": service_id,
+        "mode": "http",
+        "retries": 3,
+        "httpcheck_method": "GET",
+        "httpcheck_path": check_path,
+        "servers": [
+            {
+                "name": f"{service_id}-primary",
+                "address": backend["backend_ip"],
+                "port": backend["backend_port"],
+                "ssl": "true" if backend["scheme"].lower() == "https" else "false",
+                "verify": "false",
+            }
+        ],
+    }
+
+    rules: List[MutableMapping[str, Any]] = [{"type": "Host", "value": backend["host"]}]
+    if backend["path_prefix"] != "/":
+        rules.append({"type": "PathPrefix", "value": backend["path_prefix"]})
+
+    provider_frontend = {
+        "name": backend["router_name"],
+        "mode": "http",
+        "default_backend": service_id,
+        "rules": rules,
+        "binds": frontend_binds,
+        "tls_enabled": "true" if backend["tls_enabled"] else "false",
+        "tls_certificate": certificate_ref or "",
+    }
+    return provider_backend, provider_frontend
+
+
+# provider -> (bind formatter, per-backend payload builder)
+_PROVIDER_BUILDERS = {
+    "pfsense": (_pfsense_binds, _build_pfsense),
+    "opnsense": (_opnsense_binds, _build_opnsense),
+}
+
+
 def haproxy_payloads(
     backends: Sequence[Mapping[str, Any]] | None,
     binds: Sequence[Mapping[str, Any]] | None = None,
@@ -87,112 +202,29 @@ def haproxy_payloads(
     """Build provider specific HAProxy payloads for edge devices."""
 
     provider_key = provider.lower().strip()
-    if provider_key not in {"pfsense", "opnsense"}:
+    if provider_key not in _PROVIDER_BUILDERS:
         raise AnsibleFilterError(
             f"Unsupported HAProxy payload provider {provider!r}. Expected 'pfsense' or 'opnsense'."
         )
+    format_binds, build_payload = _PROVIDER_BUILDERS[provider_key]
 
     normalized_binds = _normalize_binds(binds)
     normalized_backends = [_normalize_backend(entry) for entry in backends or []]
 
+    # Every frontend listens on the same binds; build the provider's view of
+    # them once and share it, as the payloads are only serialised to JSON.
+    frontend_binds = format_binds(normalized_binds)
+
     provider_backends: List[Mapping[str, Any]] = []
     provider_frontends: List[Mapping[str, Any]] = []
 
     for backend in normalized_backends:
-        service_id = backend["service_id"]
-        router_name = backend["router_name"]
         check_path = backend["path_prefix"] if backend["path_prefix"] != "/" else "/"
-
-        if provider_key == "pfsense":
-            provider_backends.append(
-                {
-                    "name": service_id,
-                    "balance": "roundrobin",
-                    "health_check_enabled": True,
-                    "health_check_method": "GET",
-                    "health_check_path": check_path,
-                    "servers": [
-                        {
-                            "name": f"{service_id}-primary",
-                            "address": backend["backend_ip"],
-                            "port": backend["backend_port"],
-                            "ssl": backend["scheme"].lower() == "https",
-                        }
-                    ],
-                }
-            )
-
-            rules: List[MutableMapping[str, Any]] = [
-                {"type": "host", "value": backend["host"]}
-            ]
-            if backend["path_prefix"] != "/":
-                rules.append({"type": "path_beg", "value": backend["path_prefix"]})
-
-            provider_frontends.append(
-                {
-                    "name": router_name,
-                    "listen_addresses": [
-                        {
-                            "address": bind["address"],
-                            "port": bind["port"],
-                            "ssl": bind["tls"],
-                        }
-                        for bind in normalized_binds
-                    ],
-                    "rules": rules,
-                    "default_backend": service_id,
-                    "tls_enabled": backend["tls_enabled"],
-                    "tls_certificate_ref": certificate_ref or "",
-                }
-            )
-        else:  # opnsense
-            provider_backends.append(
-                {
-                    "name": service_id,
-                    "mode": "http",
-                    "retries": 3,
-                    "httpcheck_method": "GET",
-                    "httpcheck_path": check_path,
-                    "servers": [
-                        {
-                            "name": f"{service_id}-primary",
-                            "address": backend["backend_ip"],
-                            "port": backend["backend_port"],
-                            "ssl": (
-                                "true"
-                                if backend["scheme"].lower() == "https"
-                                else "false"
-                            ),
-                            "verify": "false",
-                        }
-                    ],
-                }
-            )
-
-            rules: List[MutableMapping[str, Any]] = [
-                {"type": "Host", "value": backend["host"]}
-            ]
-            if backend["path_prefix"] != "/":
-                rules.append({"type": "PathPrefix", "value": backend["path_prefix"]})
-
-            provider_frontends.append(
-                {
-                    "name": router_name,
-                    "mode": "http",
-                    "default_backend": service_id,
-                    "rules": rules,
-                    "binds": [
-                        {
-                            "address": bind["address"],
-                            "port": bind["port"],
-                            "ssl": "true" if bind["tls"] else "false",
-                        }
-                        for bind in normalized_binds
-                    ],
-                    "tls_enabled": "true" if backend["tls_enabled"] else "false",
-                    "tls_certificate": certificate_ref or "",
-                }
-            )
+        provider_backend, provider_frontend = build_payload(
+            backend, check_path, frontend_binds, certificate_ref
+        )
+        provider_backends.append(provider_backend)
+        provider_frontends.append(provider_frontend)
 
     return {"backends": provider_backends, "frontends": provider_frontends}
 
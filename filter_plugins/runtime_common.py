@@ -35,6 +35,13 @@ def ensure_env_entries(value: Any, *, context: str) -> List[Dict[str, Any]]:
         for name, val in value.items():
             entries.append({"name": name, "value": val})
         return entries
+    # Fast path for lists that are already {"name": ..., "value": ...} dicts,
+    # such as defaults normalized earlier; exact type checks skip the ABC
+    # machinery behind isinstance(..., Mapping).
+    if type(value) is list and all(
+        type(item) is dict and "name" in item for item in value
+    ):
+        return [{"name": item["name"], "value": item.get("value")} for item in value]
     if isinstance(value, Sequence) and not isinstance(value, (str, bytes)):
         for item in value:
             if not isinstance(item, Mapping):
@@ -263,14 +270,13 @@ def compose_environment(
     connections_per_second: Optional[Any],
 ) -> List[Dict[str, Any]]:
     inline_entries = ensure_env_entries(inline_env, context="environment")
-    environment: List[Dict[str, Any]] = []
-    names: set[str] = set()
+    # Keyed by name: the first entry for a name wins and insertion order is
+    # the output order.
+    environment: Dict[str, Dict[str, Any]] = {}
 
     def add_entry(name: str, value: Any) -> None:
-        if name in names:
-            return
-        environment.append({"name": name, "value": value})
-        names.add(name)
+        if name not in environment:
+            environment[name] = {"name": name, "value": value}
 
     for entry in inline_entries:
         add_entry(entry["name"], entry.get("value"))
@@ -287,7 +293,7 @@ def compose_environment(
             continue
         add_entry(name, f"${{{name}}}")
 
-    return environment
+    return list(environment.values())
 
 
 def merge_inline_environment(
@@ -299,14 +305,11 @@ def merge_inline_environment(
     primary_service_name: Optional[str],
 ) -> List[Dict[str, Any]]:
     inline_entries = ensure_env_entries(inline_env, context="environment")
-    merged: List[Dict[str, Any]] = []
-    names: set[str] = set()
+    merged: Dict[str, Dict[str, Any]] = {}
 
     def add_entry(name: str, value: Any) -> None:
-        if name in names:
-            return
-        merged.append({"name": name, "value": value})
-        names.add(name)
+        if name not in merged:
+            merged[name] = {"name": name, "value": value}
 
     for entry in inline_entries:
         add_entry(entry["name"], entry.get("value"))
@@ -317,7 +320,7 @@ def merge_inline_environment(
     if rotation_timestamp is not None:
         add_entry("SHMA_SECRETS_ROTATION", rotation_timestamp)
 
-    return merged
+    return list(merged.values())
 
 
 def health_spec(health: Any | None) -> Dict[str, Any]:
@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep the parsed YAML cache out of the real ``~/.cache``."""
+    monkeypatch.setenv("SHMA_CI_CACHE_DIR", str(tmp_path / "shma-ci-cache"))
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from ci import assert_no_inline_secrets as secret_check
+
+
+class CheckManifestTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmpdir = TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        self.base = Path(self._tmpdir.name)
+
+    def _write(self, name: str, content: str) -> Path:
+        path = self.base / name
+        path.write_text(content)
+        return path
+
+    def test_reports_inlined_secret_values(self) -> None:
+        manifest = self._write(
+            "docker.yml",
+            "services:\n  app:\n    environment:\n      DB_PASSWORD: hunter2\n",
+        )
+
+        result = secret_check.check_manifest(manifest, {"hunter2", "not-present"})
+
+        self.assertEqual(result, ["hunter2"])
+
+    def test_clean_manifest_reports_nothing(self) -> None:
+        manifest = self._write(
+            "docker.yml",
+            "services:\n  app:\n    env_file:\n      - /run/secrets/app.env\n",
+        )
+
+        self.assertEqual(secret_check.check_manifest(manifest, {"hunter2"}), [])
+
+    def test_quadlet_entries_are_scanned(self) -> None:
+        manifest = self._write(
+            "podman.yml",
+            "[Container]\n"
+            "Environment=API_TOKEN=s3cr3t-token\n"
+            "Volume=/srv/data:/data:Z\n"
+            "[Service]\n"
+            "Restart=always\n",
+        )
+
+        result = secret_check.check_manifest(manifest, {"s3cr3t-token", "other"})
+
+        self.assertEqual(result, ["s3cr3t-token"])
+
+    def test_regex_fallback_reports_overlapping_secrets(self) -> None:
+        manifest = self._write("docker.yml", "TOKEN=abcdef\n")
+        secrets = {"abc", "abcdef", "cde", "zzz"}
+
+        with mock.patch.object(secret_check, "ahocorasick", None):
+            result = secret_check.check_manifest(manifest, secrets)
+
+        self.assertEqual(result, ["abc", "abcdef", "cde"])
+
+    def test_non_ascii_secrets_and_empty_manifests(self) -> None:
+        manifest = self._write("docker.yml", "PASSWORD: pässwörd\n")
+        empty = self._write("empty.yml", "")
+
+        for accelerator in (secret_check.ahocorasick, None):
+            with mock.patch.object(secret_check, "ahocorasick", accelerator):
+                self.assertEqual(
+                    secret_check.check_manifest(manifest, {"pässwörd", "wö"}),
+                    ["pässwörd", "wö"],
+                )
+                self.assertEqual(secret_check.check_manifest(empty, {"wö"}), [])
+
+    def test_prune_secrets_keeps_minimal_needles(self) -> None:
+        secrets = {"line-one\nline-two", "line-one", "line-two", "abc", "xabcx", ""}
+
+        for accelerator in (secret_check.ahocorasick, None):
+            with mock.patch.object(secret_check, "ahocorasick", accelerator):
+                self.assertEqual(
+                    secret_check.prune_secrets(secrets),
+                    {"line-one", "line-two", "abc"},
+                )
+
+    def test_gather_secret_values_registers_stripped_lines(self) -> None:
+        service = {
+            "secrets": {
+                "env": [{"name": "TOKEN", "value": "abc123"}],
+                "files": [
+                    {"name": "cert", "content": "  line-one\nline-two  \n\n"},
+                ],
+            }
+        }
+
+        secrets = secret_check.gather_secret_values(service)
+
+        self.assertIn("abc123", secrets)
+        self.assertIn("line-one", secrets)
+        self.assertIn("line-two", secrets)
+        self.assertIn("  line-one\nline-two  \n\n", secrets)
+
+
+if __name__ == "__main__":
+    unittest.main()
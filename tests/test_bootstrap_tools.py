@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import io
+import os
+import sys
+import tarfile
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from ci import bootstrap_tools
+
+STUB_KUBECTL = ROOT / "bin" / "kubectl"
+
+
+class EnsureToolTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmpdir = TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.cache_dir = Path(tmpdir.name) / "cache"
+        self.bin_dir = Path(tmpdir.name) / "bin"
+        self.installed = self.bin_dir / "kubectl"
+
+        env = mock.patch.dict(os.environ)
+        env.start()
+        self.addCleanup(env.stop)
+        os.environ.pop(bootstrap_tools.OFFLINE_FLAG, None)
+
+    def _cache_binary(self, version: str, content: bytes) -> Path:
+        cached = self.cache_dir / "kubectl" / version / "kubectl"
+        cached.parent.mkdir(parents=True)
+        cached.write_bytes(content)
+        cached.chmod(0o755)
+        return cached
+
+    def test_offline_stub_does_not_overwrite_linked_cache(self) -> None:
+        cached = self._cache_binary("1.0", b"real kubectl")
+        config = {"version": "1.0", "binary": "kubectl"}
+
+        bootstrap_tools.ensure_tool("kubectl", config, self.cache_dir, self.bin_dir)
+        self.assertEqual(self.installed.read_bytes(), b"real kubectl")
+
+        os.environ[bootstrap_tools.OFFLINE_FLAG] = "1"
+        bootstrap_tools.ensure_tool("kubectl", config, self.cache_dir, self.bin_dir)
+        self.assertEqual(self.installed.read_bytes(), STUB_KUBECTL.read_bytes())
+        self.assertEqual(cached.read_bytes(), b"real kubectl")
+
+        del os.environ[bootstrap_tools.OFFLINE_FLAG]
+        bootstrap_tools.ensure_tool("kubectl", config, self.cache_dir, self.bin_dir)
+        self.assertEqual(self.installed.read_bytes(), b"real kubectl")
+
+    def test_download_fallback_does_not_overwrite_linked_cache(self) -> None:
+        cached = self._cache_binary("1.0", b"real kubectl")
+        bootstrap_tools.ensure_tool(
+            "kubectl",
+            {"version": "1.0", "binary": "kubectl"},
+            self.cache_dir,
+            self.bin_dir,
+        )
+
+        config = {
+            "version": "2.0",
+            "binary": "kubectl",
+            "artifact": "https://example.invalid/kubectl-{version}",
+            "sha256": "0" * 64,
+        }
+        failure = bootstrap_tools.DownloadError("offline")
+        with mock.patch.object(
+            bootstrap_tools, "download", side_effect=failure
+        ), mock.patch("sys.stderr"):
+            bootstrap_tools.ensure_tool("kubectl", config, self.cache_dir, self.bin_dir)
+
+        self.assertEqual(self.installed.read_bytes(), STUB_KUBECTL.read_bytes())
+        self.assertEqual(cached.read_bytes(), b"real kubectl")
+
+
+class ParseChecksumsTests(unittest.TestCase):
+    def test_parses_coreutils_checksum_lists(self) -> None:
+        upper = "AB" * 32
+        lower = "cd" * 32
+        binary = "0f" * 32
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "checksums.txt"
+            path.write_bytes(
+                f"{upper}  tool_linux_amd64.tar.gz\n"
+                f"  {lower} tool_darwin_arm64.tar.gz  \r\n"
+                f"{binary} *tool.zip\n"
+                "# comment line\n"
+                "deadbeef  too-short.tar.gz\n"
+                "\n".encode("utf-8")
+            )
+
+            checksums = bootstrap_tools.parse_checksums(path)
+
+        self.assertEqual(
+            checksums,
+            {
+                "tool_linux_amd64.tar.gz": upper.lower(),
+                "tool_darwin_arm64.tar.gz": lower,
+                "tool.zip": binary,
+            },
+        )
+
+
+class ExtractMemberTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmpdir = TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.base = Path(tmpdir.name)
+
+    def _archive(self, mode: str, suffix: str) -> Path:
+        archive = self.base / f"tool.tar{suffix}"
+        with tarfile.open(archive, mode) as tar:
+            for name, payload in (("README", b"docs"), ("dist/tool", b"binary")):
+                info = tarfile.TarInfo(name)
+                info.size = len(payload)
+                tar.addfile(info, io.BytesIO(payload))
+        # Detection must rely on the content, not on the file name.
+        renamed = self.base / f"{mode.replace(':', '-')}.bin"
+        archive.rename(renamed)
+        return renamed
+
+    def test_detects_compression_from_magic_bytes(self) -> None:
+        for mode, suffix in (
+            ("w:gz", ".gz"),
+            ("w:xz", ".xz"),
+            ("w:bz2", ".bz2"),
+            ("w:", ""),
+        ):
+            with self.subTest(mode=mode):
+                archive = self._archive(mode, suffix)
+                workspace = self.base / mode.replace(":", "-")
+                workspace.mkdir()
+
+                extracted = bootstrap_tools.extract_member(
+                    archive, "dist/tool", workspace
+                )
+
+                self.assertEqual(extracted, workspace / "tool")
+                self.assertEqual(extracted.read_bytes(), b"binary")
+                self.assertTrue(os.access(extracted, os.X_OK))
+
+    def test_missing_member_is_reported(self) -> None:
+        archive = self._archive("w:gz", ".gz")
+
+        with self.assertRaisesRegex(RuntimeError, "Member absent not found"):
+            bootstrap_tools.extract_member(archive, "absent", self.base)
+
+
+class InstallTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmpdir = TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.base = Path(tmpdir.name)
+        self.cached = self.base / "cache" / "tool"
+        self.cached.parent.mkdir()
+        self.cached.write_bytes(b"v1")
+        self.destination = self.base / "bin" / "tool"
+        self.destination.parent.mkdir()
+
+    def test_links_cached_binary(self) -> None:
+        bootstrap_tools._install(self.cached, self.destination)
+
+        self.assertTrue(os.path.samefile(self.cached, self.destination))
+        self.assertTrue(os.access(self.destination, os.X_OK))
+
+    def test_reinstall_over_link_leaves_previous_source_intact(self) -> None:
+        bootstrap_tools._install(self.cached, self.destination)
+        newer = self.base / "cache" / "tool-v2"
+        newer.write_bytes(b"v2")
+
+        bootstrap_tools._install(newer, self.destination, link=False)
+
+        self.assertEqual(self.destination.read_bytes(), b"v2")
+        self.assertEqual(self.cached.read_bytes(), b"v1")
+        self.assertFalse(os.path.samefile(newer, self.destination))
+
+    def test_copies_when_linking_fails(self) -> None:
+        self.destination.write_bytes(b"stale")
+
+        with mock.patch.object(
+            bootstrap_tools.os, "link", side_effect=OSError("cross-device")
+        ):
+            bootstrap_tools._install(self.cached, self.destination)
+
+        self.assertEqual(self.destination.read_bytes(), b"v1")
+        self.assertFalse(os.path.samefile(self.cached, self.destination))
+        self.assertTrue(os.access(self.destination, os.X_OK))
+
+
+if __name__ == "__main__":  # pragma: no cover - convenience
+    unittest.main()
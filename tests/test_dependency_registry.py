@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from filter_plugins.dependency_registry import (
+    RegistryFormatError,
+    dependency_graph_cycles,
+    merge_dependency_registries,
+)
+
+
+class DependencyGraphCyclesTests(unittest.TestCase):
+    def test_self_loop_is_reported(self) -> None:
+        registry = {"db": {"requires": ["db"]}}
+
+        self.assertEqual(dependency_graph_cycles(registry), ["db -> db"])
+
+    def test_three_node_cycle_is_reported_once(self) -> None:
+        registry = {
+            "web": {"requires": ["cache"]},
+            "cache": {"requires": [{"name": "db"}]},
+            "db": {"requires": {"web": {"version": "1.0"}}},
+        }
+
+        self.assertEqual(
+            dependency_graph_cycles(registry), ["cache -> db -> web -> cache"]
+        )
+
+    def test_current_service_closes_cycle(self) -> None:
+        registry = {"db": {"requires": ["app"]}}
+
+        self.assertEqual(dependency_graph_cycles(registry), [])
+        self.assertEqual(
+            dependency_graph_cycles(registry, "app", ["db"]), ["app -> db -> app"]
+        )
+
+
+class MergeDependencyRegistriesTests(unittest.TestCase):
+    def test_duplicate_requirements_are_collapsed(self) -> None:
+        first = {
+            "dependencies": {
+                "app": {"version": "1.0", "requires": ["db", {"name": "cache"}]}
+            }
+        }
+        second = {
+            "app": {
+                "requires": [
+                    {"name": "db", "version": "15", "exports_hash": "abc"},
+                    "queue",
+                ]
+            }
+        }
+
+        merged = merge_dependency_registries([first, None, second])
+
+        self.assertEqual(
+            merged,
+            {
+                "app": {
+                    "version": "1.0",
+                    "requires": [
+                        {"name": "db", "version": "15", "exports_hash": "abc"},
+                        {"name": "cache"},
+                        {"name": "queue"},
+                    ],
+                }
+            },
+        )
+
+    def test_version_conflict_raises(self) -> None:
+        fragments = [{"db": {"version": "15"}}, {"db": {"version": "16"}}]
+
+        with self.assertRaisesRegex(RegistryFormatError, "Conflicting versions"):
+            merge_dependency_registries(fragments)
+
+    def test_matching_versions_merge(self) -> None:
+        fragments = [{"db": {"version": "15"}}, {"db": {"version": "15"}}]
+
+        self.assertEqual(
+            merge_dependency_registries(fragments), {"db": {"version": "15"}}
+        )
+
+
+if __name__ == "__main__":  # pragma: no cover - convenience
+    unittest.main()
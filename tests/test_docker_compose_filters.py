@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import unittest
+
+import pytest
+
+pytest.importorskip("ansible")
+
+from filter_plugins.docker_compose import docker_compose_prepare_services
+
+
+class DockerComposePrepareServicesTests(unittest.TestCase):
+    def test_input_services_are_not_mutated(self) -> None:
+        service = {
+            "name": "app",
+            "security_opt": ["apparmor=docker-default", "apparmor=docker-default"],
+            "tmpfs": ["/tmp"],
+        }
+
+        prepared = docker_compose_prepare_services([service])
+
+        self.assertEqual(
+            prepared[0]["render_security_opt"],
+            ["apparmor=docker-default", "no-new-privileges:true"],
+        )
+        self.assertNotIn("render_security_opt", service)
+
+        prepared[0]["name"] = "renamed"
+        self.assertEqual(service["name"], "app")
+
+
+if __name__ == "__main__":  # pragma: no cover - convenience
+    unittest.main()
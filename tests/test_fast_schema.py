@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import copy
+import sys
+import unittest
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+pytest.importorskip("fastjsonschema")
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import jsonschema
+
+from ci import validate_proxmox_manifest, validate_schema
+
+if not hasattr(jsonschema.Draft202012Validator, "META_SCHEMA"):
+    pytest.skip(
+        "comparing engines needs the real jsonschema package",
+        allow_module_level=True,
+    )
+
+SCHEMAS = ROOT / "schemas"
+# Values swapped into each node of a valid document to derive invalid ones.
+REPLACEMENTS = (None, 12345, "not-a-valid-value", [], {})
+_REMOVE = object()
+
+PROXMOX_MANIFEST = {
+    "container_ip": "192.0.2.34",
+    "container": {
+        "vmid": "108",
+        "hostname": "example",
+        "ostemplate": "tpl",
+        "disk": "5",
+        "cores": "1",
+        "memory": "512",
+        "swap": "512",
+        "netif": {"net0": "name=eth0"},
+        "onboot": "yes",
+        "unprivileged": "yes",
+        "firewall": {
+            "enabled": True,
+            "rules": [
+                {"action": "Accept", "direction": "in", "enable": True},
+                {"action": "drop", "direction": "out", "log": False},
+            ],
+        },
+    },
+    "setup": {"packages": [], "config": [], "services": [], "commands": []},
+}
+
+
+def _variants(document: Any) -> Iterator[Any]:
+    """Yield *document* and copies with one node removed or replaced."""
+
+    yield document
+    for path in _paths(document):
+        *parents, last = path
+        for replacement in (*REPLACEMENTS, _REMOVE):
+            variant = copy.deepcopy(document)
+            container = variant
+            for key in parents:
+                container = container[key]
+            if replacement is _REMOVE:
+                del container[last]
+            else:
+                container[last] = copy.deepcopy(replacement)
+            yield variant
+
+
+def _paths(node: Any, prefix: tuple = ()) -> Iterator[tuple]:
+    children = (
+        node.items()
+        if isinstance(node, dict)
+        else enumerate(node) if isinstance(node, list) else ()
+    )
+    for key, value in children:
+        yield (*prefix, key)
+        yield from _paths(value, (*prefix, key))
+
+
+class FastCheckAgreementTests(unittest.TestCase):
+    """fastjsonschema must never accept a document jsonschema rejects.
+
+    A rejection by the compiled check is always re-checked by jsonschema, but
+    an acceptance is final, so the two engines are compared over the repo's
+    examples and every single-node mutation of them.
+    """
+
+    def assert_never_looser(
+        self, validator: Any, fast_check: Any, documents: list[Any]
+    ) -> None:
+        self.assertIsNotNone(fast_check, "schema did not compile")
+        checked = 0
+        for document in documents:
+            for variant in _variants(document):
+                checked += 1
+                if fast_check(variant):
+                    error = next(validator.iter_errors(variant), None)
+                    self.assertIsNone(
+                        error, f"fastjsonschema accepted {variant!r}: {error}"
+                    )
+        self.assertGreater(checked, len(documents))
+
+    def _load_validator(self, schema_path: Path) -> Any:
+        result = validate_schema.validate_schema(schema_path)
+        self.assertIsInstance(result, tuple)
+        return result[1]
+
+    def test_service_schema(self) -> None:
+        schema_path = SCHEMAS / "service.schema.yml"
+        samples = sorted((ROOT / "tests" / "samples").glob("*.yml"))
+        samples += [
+            ROOT / "tests" / "sample_service.yml",
+            ROOT / "tests" / "sample_service_ingress.yml",
+        ]
+
+        self.assert_never_looser(
+            self._load_validator(schema_path),
+            validate_schema.schema_fast_check(schema_path),
+            [validate_schema.load_yaml(path) for path in samples],
+        )
+
+    def test_dependency_registry_schema(self) -> None:
+        schema_path = SCHEMAS / "dependency-registry.schema.yml"
+
+        self.assert_never_looser(
+            self._load_validator(schema_path),
+            validate_schema.schema_fast_check(schema_path),
+            [validate_schema.load_yaml(ROOT / "tests" / "dependency_registry.yml")],
+        )
+
+    def test_proxmox_schema(self) -> None:
+        schema_path = SCHEMAS / "proxmox.schema.yml"
+
+        self.assert_never_looser(
+            validate_proxmox_manifest._schema_validator(schema_path),
+            validate_proxmox_manifest._schema_fast_check(schema_path),
+            [PROXMOX_MANIFEST],
+        )
+
+
+if __name__ == "__main__":  # pragma: no cover - convenience
+    unittest.main()
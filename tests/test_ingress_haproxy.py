@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import json
+import sys
+import unittest
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("ansible")
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from filter_plugins.ingress_haproxy import haproxy_payloads
+
+CONTRACT_FILE = ROOT / "tests/edge_matrix/contracts.json"
+EXPECTED_DIR = ROOT / "tests/edge_matrix/expected"
+
+# The duplicate 443 bind (port given as a string) must collapse into one entry.
+BINDS = [
+    {"address": "0.0.0.0", "port": 80, "tls": False},
+    {"address": "0.0.0.0", "port": 443, "tls": True},
+    {"address": "0.0.0.0", "port": "443", "tls": True},
+]
+
+
+class HaproxyPayloadsTests(unittest.TestCase):
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.contracts = json.loads(CONTRACT_FILE.read_text(encoding="utf-8"))[
+            "edge_ingress_contracts"
+        ]
+
+    def assert_matches_recorded(
+        self,
+        provider: str,
+        expected_file: str,
+        certificate_field: str,
+        bind_field: str,
+    ) -> None:
+        payload = haproxy_payloads(
+            self.contracts, BINDS, provider=provider, certificate_ref="cert-ref"
+        )
+        actual = json.loads(json.dumps(payload))
+        expected = json.loads((EXPECTED_DIR / expected_file).read_text("utf-8"))["body"]
+
+        # The recorded payloads only reference a certificate on TLS frontends,
+        # whereas the filter applies the one it is given to every frontend.
+        for frontend in actual["frontends"]:
+            self.assertEqual(frontend.pop(certificate_field), "cert-ref")
+        for frontend in expected["frontends"]:
+            del frontend[certificate_field]
+
+        self.assertEqual(actual, expected)
+
+        # Every frontend listens on the same binds, so they share one list.
+        first, *rest = payload["frontends"]
+        for frontend in rest:
+            self.assertIs(frontend[bind_field], first[bind_field])
+
+    def test_pfsense_payload_matches_recorded(self) -> None:
+        self.assert_matches_recorded(
+            "pfsense",
+            "pfsense_haproxy_config.json",
+            "tls_certificate_ref",
+            "listen_addresses",
+        )
+
+    def test_opnsense_payload_matches_recorded(self) -> None:
+        self.assert_matches_recorded(
+            "opnsense", "opnsense_haproxy_bulkImport.json", "tls_certificate", "binds"
+        )
+
+    def test_provider_name_is_normalized(self) -> None:
+        self.assertEqual(
+            haproxy_payloads(self.contracts, BINDS, provider=" PFSense "),
+            haproxy_payloads(self.contracts, BINDS, provider="pfsense"),
+        )
+
+
+if __name__ == "__main__":  # pragma: no cover - convenience
+    unittest.main()
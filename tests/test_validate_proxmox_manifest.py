@@ -7,6 +7,7 @@ import unittest
 from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest import mock
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
@@ -14,6 +15,8 @@ if str(ROOT) not in sys.path:
 
 from ci import validate_proxmox_manifest as proxmox_validator
 
+PROXMOX_SCHEMA = ROOT / "schemas" / "proxmox.schema.yml"
+
 
 class ValidateProxmoxManifestTests(unittest.TestCase):
     @classmethod
@@ -274,7 +277,8 @@ class ValidateProxmoxManifestTests(unittest.TestCase):
         }
         service = {"needs_container_runtime": True}
 
-        result, stdout, stderr = self._run_validator(manifest, service)
+        with mock.patch.object(proxmox_validator, "SCHEMA_PATH", PROXMOX_SCHEMA):
+            result, stdout, stderr = self._run_validator(manifest, service)
 
         self.assertEqual(result, 0)
         self.assertIn("Validated Proxmox manifest", stdout)
@@ -308,10 +312,83 @@ class ValidateProxmoxManifestTests(unittest.TestCase):
         }
         service = {"needs_container_runtime": True}
 
-        result, _, stderr = self._run_validator(manifest, service)
+        with mock.patch.object(proxmox_validator, "SCHEMA_PATH", PROXMOX_SCHEMA):
+            result, _, stderr = self._run_validator(manifest, service)
 
         self.assertEqual(result, 1)
-        self.assertIn("direction must be 'in' or 'out'", stderr)
+        self.assertIn("is not one of", stderr)
+
+    def _firewall_manifest(self, rules: list) -> dict:
+        return {
+            "container_ip": "192.0.2.34",
+            "container": {
+                "vmid": "108",
+                "hostname": "example",
+                "ostemplate": "tpl",
+                "disk": "5",
+                "cores": "1",
+                "memory": "512",
+                "swap": "512",
+                "netif": {"net0": "name=eth0"},
+                "onboot": "yes",
+                "unprivileged": "yes",
+                "firewall": {"enabled": True, "rules": rules},
+            },
+            "setup": {
+                "packages": [],
+                "config": [],
+                "services": [],
+                "commands": [],
+            },
+        }
+
+    def test_firewall_actions_match_case_insensitively(self) -> None:
+        manifest = self._firewall_manifest(
+            [
+                {"action": "Accept", "direction": "in", "enable": True},
+                {"action": "reject", "direction": "out", "log": False},
+                {"action": "DROP"},
+            ]
+        )
+        service = {"needs_container_runtime": True}
+
+        with mock.patch.object(proxmox_validator, "SCHEMA_PATH", PROXMOX_SCHEMA):
+            result, _, stderr = self._run_validator(manifest, service)
+
+        self.assertEqual(result, 0, stderr)
+
+    def test_firewall_rules_rejected_by_schema(self) -> None:
+        service = {"needs_container_runtime": True}
+        cases = [
+            [{"action": "allow"}],
+            [{"action": "accept "}],
+            [{"direction": "in"}],
+            [None],
+            [{"action": "DROP", "enable": 1}],
+            [{"action": "DROP", "log": "yes"}],
+        ]
+
+        for rules in cases:
+            with self.subTest(rules=rules), mock.patch.object(
+                proxmox_validator, "SCHEMA_PATH", PROXMOX_SCHEMA
+            ):
+                result, _, stderr = self._run_validator(
+                    self._firewall_manifest(rules), service
+                )
+
+            self.assertEqual(result, 1)
+            self.assertIn("Proxmox manifest validation failed", stderr)
+
+    def test_schema_validator_reused_until_schema_changes(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            schema_path = Path(tmpdir) / "schema.json"
+            schema_path.write_text(json.dumps({"type": "object"}))
+
+            first = proxmox_validator._schema_validator(schema_path)
+            self.assertIs(proxmox_validator._schema_validator(schema_path), first)
+
+            schema_path.write_text(json.dumps({"type": "object", "required": []}))
+            self.assertIsNot(proxmox_validator._schema_validator(schema_path), first)
 
 
 if __name__ == "__main__":
@@ -1,19 +1,24 @@
 from __future__ import annotations
 
 import io
+import sys
 import unittest
 from contextlib import redirect_stderr
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
 from ci import validate_schema
 
+SERVICE_SCHEMA = ROOT / "schemas" / "service.schema.yml"
+
 
 class ValidateServiceExamplesTests(unittest.TestCase):
     def test_invalid_service_definition_reports_error(self) -> None:
-        schema_result = validate_schema.validate_schema(
-            Path("schemas/service.schema.yml")
-        )
+        schema_result = validate_schema.validate_schema(SERVICE_SCHEMA)
         self.assertIsInstance(schema_result, tuple)
         _, validator = schema_result
 
@@ -29,6 +34,15 @@ class ValidateServiceExamplesTests(unittest.TestCase):
         self.assertEqual(result, 1)
         self.assertIn("invalid.yml", buffer.getvalue())
 
+    def test_validator_is_reused_for_unchanged_schema(self) -> None:
+        schema_path = SERVICE_SCHEMA
+
+        first = validate_schema.validate_schema(schema_path)
+        second = validate_schema.validate_schema(schema_path)
+
+        self.assertIsInstance(first, tuple)
+        self.assertIs(first[1], second[1])
+
 
 if __name__ == "__main__":
     unittest.main()
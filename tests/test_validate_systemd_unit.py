@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from ci import validate_systemd_unit as unit_validator
+
+
+class ScanServiceDirectivesTests(unittest.TestCase):
+    def test_collects_repeated_service_directives_only(self) -> None:
+        unit = (
+            b"[Unit]\r\n"
+            b"ProtectSystem=ignored\r\n"
+            b"[Service]\r\n"
+            b"# ProtectHome=commented\r\n"
+            b"  ProtectSystem = strict  \r\n"
+            b"TemporaryFileSystem=/tmp:rw\r\n"
+            b"TemporaryFileSystem=/run\r\n"
+            b"ExecStart=/bin/true\r\n"
+            b"[Install]\r\n"
+            b"ProtectHome=no\r\n"
+        )
+
+        self.assertEqual(
+            unit_validator.scan_service_directives(unit),
+            {
+                "ProtectSystem": ["strict"],
+                "TemporaryFileSystem": ["/tmp:rw", "/run"],
+            },
+        )
+
+    def test_missing_service_section_returns_none(self) -> None:
+        self.assertIsNone(unit_validator.scan_service_directives(b"[Unit]\n"))
+        self.assertEqual(unit_validator.scan_service_directives(b"[Service]\n"), {})
+
+
+if __name__ == "__main__":  # pragma: no cover - convenience
+    unittest.main()
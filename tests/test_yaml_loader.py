@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from ci import yaml_loader
+
+
+class CachedLoadTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmpdir = TemporaryDirectory()
+        self.base = Path(self._tmpdir.name)
+        self.cache_dir = self.base / "cache"
+        patcher = mock.patch.dict(
+            os.environ, {yaml_loader.CACHE_DIR_ENV: str(self.cache_dir)}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._tmpdir.cleanup)
+
+    def test_reuses_cached_document_for_unchanged_file(self) -> None:
+        source = self.base / "service.yml"
+        source.write_text("service_id: cached\n")
+
+        first = yaml_loader.cached_load(source)
+        self.assertEqual(first, {"service_id": "cached"})
+        self.assertEqual(len(list((self.cache_dir / "yaml").glob("*.pkl"))), 1)
+
+        with mock.patch.object(yaml_loader, "safe_load") as parse:
+            second = yaml_loader.cached_load(source)
+
+        parse.assert_not_called()
+        self.assertEqual(second, first)
+
+    def test_reparses_after_file_changes(self) -> None:
+        source = self.base / "service.yml"
+        source.write_text("service_id: before\n")
+        yaml_loader.cached_load(source)
+
+        source.write_text("service_id: after-change\n")
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        self.assertEqual(
+            yaml_loader.cached_load(source), {"service_id": "after-change"}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()